@@ -4,8 +4,12 @@ This module fetches recent commits from the main branch to keep agents
 informed about new MCP tooling and repository changes without manual edits.
 """
 
+import hashlib
 import logging
+import os
 import subprocess
+import tempfile
+import time
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -25,6 +29,13 @@ DEFAULT_KEYWORDS = [
 # Special prefix for explicitly marked agent updates
 AGENT_UPDATE_MARKER = "[agent-update]"
 
+# On-disk cache for the formatted section, shared across process invocations
+UPDATES_CACHE_TTL_SECONDS = 60
+UPDATES_CACHE_DIR_NAME = "mcp-experiment-001"
+
+# Only the first few body lines are ever shown in the prompt section
+MAX_BODY_LINES = 3
+
 
 @dataclass
 class CommitInfo:
@@ -67,64 +78,126 @@ def get_repo_root() -> Path | None:
     return None
 
 
-def get_main_branch_name() -> str:
-    """Detect the name of the main branch (main or master).
+def _find_repo_root() -> Path | None:
+    """Find the repository root by walking up from the working directory.
+
+    Unlike get_repo_root(), this does not spawn a git process.
 
     Returns:
-        Full branch reference (e.g., 'origin/main' if only remote exists)
+        Path to the directory containing `.git`, or None if not found
+    """
+    cwd = Path.cwd()
+    for candidate in (cwd, *cwd.parents):
+        if (candidate / ".git").exists():
+            return candidate
+    return None
+
+
+def _read_refs(repo_root: Path) -> dict[str, str] | None:
+    """Read branch refs directly from the `.git` directory.
+
+    Scans `packed-refs` plus the loose refs under `refs/heads/` and
+    `refs/remotes/origin/`, so the common case needs no git subprocess.
+
+    Args:
+        repo_root: Repository root directory
+
+    Returns:
+        Mapping of ref name to symbolic-ref target ("" for plain refs), or
+        None if the layout is unusual (e.g. a worktree where `.git` is a file)
+    """
+    git_dir = repo_root / ".git"
+    if not git_dir.is_dir():
+        return None
+
+    refs: dict[str, str] = {}
+    try:
+        packed = (git_dir / "packed-refs").read_text()
+    except FileNotFoundError:
+        packed = ""
+    except OSError:
+        return None
+
+    for line in packed.splitlines():
+        # Skip the header comment and peeled-tag lines ("^<sha>")
+        if not line or line[0] in "#^":
+            continue
+        _, _, name = line.partition(" ")
+        if name:
+            refs[name.strip()] = ""
+
+    try:
+        for prefix in ("refs/heads", "refs/remotes/origin"):
+            for path in (git_dir / prefix).glob("*"):
+                if not path.is_file():
+                    continue
+                content = path.read_text().strip()
+                target = content[5:].strip() if content.startswith("ref: ") else ""
+                refs[f"{prefix}/{path.name}"] = target
+    except OSError:
+        return None
+
+    return refs
+
+
+def _list_refs_via_git() -> dict[str, str]:
+    """List branch refs with a single `git for-each-ref` call.
+
+    Fallback for repository layouts that _read_refs() cannot handle.
+
+    Returns:
+        Mapping of ref name to symbolic-ref target ("" for plain refs)
     """
+    refs: dict[str, str] = {}
     try:
-        # Try to get the default branch from remote
         result = subprocess.run(
-            ["git", "symbolic-ref", "refs/remotes/origin/HEAD"],
+            [
+                "git",
+                "for-each-ref",
+                "--format=%(refname) %(symref)",
+                "refs/heads",
+                "refs/remotes/origin",
+            ],
             capture_output=True,
             text=True,
             timeout=5,
         )
         if result.returncode == 0:
-            # Returns something like "refs/remotes/origin/main"
-            branch_name = result.stdout.strip().split("/")[-1]
-            # Check if local branch exists
-            local_check = subprocess.run(
-                ["git", "rev-parse", "--verify", branch_name],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if local_check.returncode == 0:
-                return branch_name
-            # Use remote branch
-            return f"origin/{branch_name}"
+            for line in result.stdout.splitlines():
+                name, _, target = line.partition(" ")
+                if name:
+                    refs[name] = target.strip()
     except (subprocess.TimeoutExpired, FileNotFoundError):
         pass
+    return refs
 
-    # Fallback: check if main or master exists (local or remote)
-    for branch in ["main", "master"]:
-        # Try local first
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "--verify", branch],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                return branch
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
 
-        # Try remote
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "--verify", f"origin/{branch}"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                return f"origin/{branch}"
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+def get_main_branch_name() -> str:
+    """Detect the name of the main branch (main or master).
+
+    Returns:
+        Full branch reference (e.g., 'origin/main' if only remote exists)
+    """
+    refs = None
+    repo_root = _find_repo_root()
+    if repo_root is not None:
+        refs = _read_refs(repo_root)
+    if refs is None:
+        refs = _list_refs_via_git()
+
+    candidates = ["main", "master"]
+
+    # Prefer the remote's default branch (e.g. "refs/remotes/origin/main")
+    origin_head = refs.get("refs/remotes/origin/HEAD", "")
+    if origin_head:
+        candidates.insert(0, origin_head.split("/")[-1])
+
+    for branch in candidates:
+        # Try local first, then remote
+        if f"refs/heads/{branch}" in refs:
+            return branch
+        if f"refs/remotes/origin/{branch}" in refs:
+            return f"origin/{branch}"
 
     return "origin/main"  # Default fallback
 
@@ -229,6 +302,8 @@ def fetch_recent_commits(
                     CommitInfo(
                         hash=parts[0][:8],  # Short hash
                         subject=parts[1].strip(),
+                        # Full body: keyword matching needs all of it;
+                        # format_updates_section trims what is displayed
                         body=parts[2].strip(),
                         author=parts[3].strip(),
                         date=parts[4].strip()[:10],  # Just the date part
@@ -319,7 +394,7 @@ def format_updates_section(
         # Include body if it's an agent update and has meaningful content
         if commit.is_agent_update and commit.body:
             # Indent body lines and limit length
-            body_lines = commit.body.split("\n")[:3]  # Max 3 lines from body
+            body_lines = commit.body.split("\n", MAX_BODY_LINES)[:MAX_BODY_LINES]
             for body_line in body_lines:
                 body_line = body_line.strip()
                 if body_line:
@@ -338,6 +413,93 @@ def format_updates_section(
     return "\n".join(lines)
 
 
+def _updates_cache_path(
+    limit: int,
+    max_display: int,
+    keywords: list[str] | None,
+    branch: str | None,
+) -> Path:
+    """Get the cache file path for a given set of section parameters.
+
+    Returns:
+        Path under $XDG_CACHE_HOME (default ~/.cache)
+    """
+    cache_root = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    key = repr((str(Path.cwd()), limit, max_display, keywords, branch))
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return Path(cache_root) / UPDATES_CACHE_DIR_NAME / f"updates-{digest}.txt"
+
+
+def _branch_stamp(branch: str) -> str | None:
+    """Get a cheap stamp for the tip of a branch (mtime of its ref file).
+
+    `.git/HEAD` only changes when switching branches, so the stamp comes
+    from the branch's loose ref, or `packed-refs` once the ref is packed.
+
+    Args:
+        branch: Branch reference as passed to `git log` (e.g. 'main',
+            'origin/main' or 'HEAD')
+
+    Returns:
+        Stamp string, or None if the ref file cannot be found
+    """
+    repo_root = _find_repo_root()
+    if repo_root is None:
+        return None
+    git_dir = repo_root / ".git"
+    if branch == "HEAD":
+        try:
+            head = (git_dir / "HEAD").read_text().strip()
+        except OSError:
+            return None
+        # A detached HEAD holds the commit itself
+        ref = head[5:].strip() if head.startswith("ref: ") else "HEAD"
+    elif branch.startswith("origin/"):
+        ref = f"refs/remotes/{branch}"
+    else:
+        ref = f"refs/heads/{branch}"
+
+    for path in (git_dir / ref, git_dir / "packed-refs"):
+        try:
+            return f"{ref} {path.stat().st_mtime_ns}"
+        except OSError:
+            continue
+    return None
+
+
+def _read_cached_section(cache_path: Path, stamp: str) -> str | None:
+    """Read a cached updates section if it is fresh and the branch is unchanged.
+
+    Returns:
+        Cached section string, or None on a cache miss
+    """
+    try:
+        if time.time() - cache_path.stat().st_mtime > UPDATES_CACHE_TTL_SECONDS:
+            return None
+        cached_stamp, _, section = cache_path.read_text().partition("\n")
+    except OSError:
+        return None
+    if cached_stamp != stamp:
+        return None
+    return section
+
+
+def _write_cached_section(cache_path: Path, stamp: str, section: str) -> None:
+    """Atomically write the updates section to the cache file."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(f"{stamp}\n{section}")
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.debug(f"Could not write updates cache: {e}")
+
+
 def get_agent_updates_prompt_section(
     limit: int = 15,
     max_display: int = 10,
@@ -346,7 +508,9 @@ def get_agent_updates_prompt_section(
 ) -> str:
     """Get the formatted updates section for the system prompt.
 
-    This is the main entry point for getting agent updates.
+    This is the main entry point for getting agent updates. The result is
+    cached on disk for UPDATES_CACHE_TTL_SECONDS so short-lived processes
+    skip git entirely while the branch tip is unchanged.
 
     Args:
         limit: Number of commits to fetch from git
@@ -357,10 +521,25 @@ def get_agent_updates_prompt_section(
     Returns:
         Formatted updates section string, or empty string if no updates
     """
+    cache_path = _updates_cache_path(limit, max_display, keywords, branch)
+    if branch is None:
+        branch = get_main_branch_name()
+    stamp = _branch_stamp(branch)
+    if stamp is not None:
+        cached = _read_cached_section(cache_path, stamp)
+        if cached is not None:
+            return cached
+
     try:
         commits = fetch_recent_commits(limit=limit, branch=branch)
         relevant = filter_relevant_commits(commits, keywords=keywords)
-        return format_updates_section(relevant, max_commits=max_display)
+        section = format_updates_section(relevant, max_commits=max_display)
     except Exception as e:
         logger.warning(f"Failed to generate agent updates section: {e}")
         return ""
+
+    # No commits usually means git failed (it logs and returns []); don't
+    # pin that empty section in the cache for the rest of the TTL
+    if stamp is not None and commits:
+        _write_cached_section(cache_path, stamp, section)
+    return section
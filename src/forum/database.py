@@ -1,38 +1,558 @@
 """Database module for forum MCP server using SQLite."""
 
 import os
+import queue
 import sqlite3
-from datetime import UTC, datetime
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
-# Register datetime adapter/converter to avoid deprecation warnings in Python 3.12+
-# Store datetime as ISO format strings (SQLite doesn't have native datetime type)
-sqlite3.register_adapter(datetime, lambda dt: dt.isoformat())
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Bumped when stored data needs a one-shot migration (PRAGMA user_version)
+SCHEMA_VERSION = 3
+
+
+def _to_epoch_us(dt: datetime) -> int:
+    """Convert a datetime to integer microseconds since the Unix epoch."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)  # SQLite CURRENT_TIMESTAMP is naive UTC
+    return (dt - EPOCH) // _MICROSECOND
+
+
+def _utcnow() -> datetime:
+    """Return the current time for created_at/updated_at columns."""
+    return datetime.now(UTC)
+
+
+def _epoch_us_to_iso(value: bytes) -> str:
+    """Convert a stored TIMESTAMP column back to an ISO 8601 string."""
+    try:
+        return (EPOCH + timedelta(microseconds=int(value))).isoformat()
+    except ValueError:
+        return value.decode()  # Legacy ISO text value
+
+
+# Timestamps are stored as INTEGER microseconds since the epoch: compact
+# index entries and integer comparisons for ORDER BY updated_at. Columns
+# declared TIMESTAMP are converted back to ISO strings when read
+# (connections use detect_types=PARSE_DECLTYPES), so callers still get
+# the same ISO format as before.
+sqlite3.register_adapter(datetime, _to_epoch_us)
+sqlite3.register_converter("TIMESTAMP", _epoch_us_to_iso)
+
+# Applied once when the persistent connection is opened
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -64000",  # 64 MB page cache
+    "PRAGMA mmap_size = 268435456",  # 256 MB
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA foreign_keys = ON",
+)
+
+# The trigram tokenizer indexes every 3-character window, so FTS5 MATCH
+# keeps the case-insensitive substring semantics of LIKE '%q%'. Shorter
+# queries contain no full trigram and fall back to LIKE.
+FTS_MIN_QUERY_LENGTH = 3
+
+# FTS5 column-filter prefix for each search_in value
+FTS_COLUMN_FILTERS = {
+    "title": 'title: "',
+    "body": 'body: "',
+    "author": 'author: "',
+    "all": '{title body author}: "',
+}
+
+# WHERE clause of the LIKE search fallback for each search_in value
+LIKE_SEARCH_CLAUSES = {
+    "title": "title LIKE :pattern",
+    "body": "body LIKE :pattern",
+    "author": "author LIKE :pattern",
+    "all": "(title LIKE :pattern OR body LIKE :pattern OR author LIKE :pattern)",
+}
+
+# Size of each connection's compiled-statement LRU (sqlite3 default is 128)
+STATEMENT_CACHE_SIZE = 256
+
+# Number of distinct list_threads(limit) results kept in memory
+LIST_CACHE_SIZE = 16
+
+# Number of assembled read_thread results kept in memory
+THREAD_CACHE_SIZE = 128
+
+# SQLite VM instructions between deadline checks on timed reads
+PROGRESS_HANDLER_OPS = 1000
+
+# busy_timeout of the checkpoint connection: a checkpoint that can't get
+# the locks it needs soon gives up (and is retried later) instead of waiting
+CHECKPOINT_BUSY_TIMEOUT_MS = 100
+
+# A write operation runs against a cursor inside an open transaction
+WriteOp = Callable[[sqlite3.Cursor], Any]
+
+
+def _thread_dicts(rows: list[tuple]) -> list[dict[str, Any]]:
+    """Build thread dictionaries from (id, title, body, author, created_at,
+    updated_at) tuples."""
+    return [
+        {
+            "id": id_,
+            "title": title,
+            "body": body,
+            "author": author,
+            "created_at": created_at,
+            "updated_at": updated_at,
+        }
+        for id_, title, body, author, created_at, updated_at in rows
+    ]
+
+
+THREAD_COLUMNS = ("id", "title", "body", "author", "created_at", "updated_at")
+
+
+def _thread_columns(rows: list[tuple]) -> dict[str, list[Any]]:
+    """Transpose thread row tuples into one list per column."""
+    if not rows:
+        return {column: [] for column in THREAD_COLUMNS}
+    return dict(zip(THREAD_COLUMNS, map(list, zip(*rows)), strict=True))
+
+
+def _build_thread_result(thread_id: int, rows: list[tuple]) -> dict[str, Any]:
+    """Assemble the read_thread result from the fused thread/posts rows.
+
+    Rows are (kind, id, title, body, author, created_at, updated_at,
+    quote_post_id, quoted_post_body); the first row is the thread.
+    """
+    # Build thread dictionary
+    _, id_, title, body, author, created_at, updated_at, _, _ = rows[0]
+    thread = {
+        "id": id_,
+        "title": title,
+        "body": body,
+        "author": author,
+        "created_at": created_at,
+        "updated_at": updated_at,
+    }
+
+    # Build posts list
+    posts = []
+    for row in rows[1:]:
+        _, post_id, _, body, author, created_at, _, quote_post_id, quoted_body = row
+        post_dict = {
+            "id": post_id,
+            "thread_id": thread_id,
+            "body": body,
+            "author": author,
+            "quote_post_id": quote_post_id,
+            "created_at": created_at,
+        }
+        # Include quoted post body if this post quotes another post
+        if quote_post_id is not None:
+            post_dict["quoted_post_body"] = quoted_body
+        posts.append(post_dict)
+
+    return {"thread": thread, "posts": posts}
+
+
+class _WriteQueue:
+    """Background writer that coalesces queued writes into shared transactions.
+
+    Each batch runs in one BEGIN IMMEDIATE ... COMMIT, so the commit cost is
+    paid once per batch instead of once per write. Every operation runs in its
+    own savepoint, so a failing write only rolls back itself.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        lock: threading.RLock,
+        batch_size: int = 500,
+        batch_wait_ms: float = 10,
+    ):
+        self._conn = conn
+        self._lock = lock
+        self._batch_size = batch_size
+        self._batch_wait = batch_wait_ms / 1000
+        self._queue: queue.Queue[tuple[WriteOp, Future] | None] = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="forum-db-writer", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, op: WriteOp) -> Future:
+        """Queue a write operation.
+
+        Returns:
+            Future resolved with the operation's return value
+        """
+        future: Future = Future()
+        self._queue.put((op, future))
+        return future
+
+    def close(self) -> None:
+        """Flush pending writes and stop the writer thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            batch = [item]
+            stopping = False
+            deadline = time.monotonic() + self._batch_wait
+            while len(batch) < self._batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._commit_batch(batch)
+            if stopping:
+                return
+
+    def _commit_batch(self, batch: list[tuple[WriteOp, Future]]) -> None:
+        outcomes: list[tuple[Future, Any, BaseException | None]] = []
+        with self._lock:
+            cursor = self._conn.cursor()
+            try:
+                cursor.execute("BEGIN IMMEDIATE")
+                for op, future in batch:
+                    cursor.execute("SAVEPOINT write_op")
+                    try:
+                        result = op(cursor)
+                    except Exception as e:
+                        cursor.execute("ROLLBACK TO write_op")
+                        cursor.execute("RELEASE write_op")
+                        outcomes.append((future, None, e))
+                    else:
+                        cursor.execute("RELEASE write_op")
+                        outcomes.append((future, result, None))
+                cursor.execute("COMMIT")
+            except sqlite3.Error as e:
+                if self._conn.in_transaction:
+                    cursor.execute("ROLLBACK")
+                for _, future in batch:
+                    future.set_exception(e)
+                return
+
+        for future, result, error in outcomes:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
 
 
 class ForumDatabase:
     """Manages SQLite database for forum threads and posts."""
 
-    def __init__(self, db_path: str | None = None):
+    # Clock for new rows; tests replace it to get distinct timestamps
+    _now = staticmethod(_utcnow)
+
+    # Hot-path SQL is kept as fixed strings so the connection's statement
+    # cache (keyed by SQL text) reuses the compiled statements across calls
+    _SQL_INSERT_THREAD = """
+        INSERT INTO threads (title, body, author, created_at, updated_at)
+        VALUES (?, ?, ?, ?, ?)
+        RETURNING id
+    """
+    # The posts_bump_thread trigger updates threads.updated_at
+    _SQL_INSERT_POST = """
+        INSERT INTO posts (thread_id, body, author, quote_post_id, created_at)
+        VALUES (?, ?, ?, ?, ?)
+        RETURNING id
+    """
+    # id breaks updated_at ties, so keyset pages neither skip nor repeat rows
+    _SQL_LIST_THREADS = """
+        SELECT id, title, body, author, created_at, updated_at
+        FROM threads
+        ORDER BY updated_at DESC, id DESC
+    """
+    _SQL_LIST_THREADS_LIMIT = _SQL_LIST_THREADS + " LIMIT ?"
+    # Keyset page: seeks idx_threads_updated_at_id past the cursor
+    _SQL_LIST_THREADS_BEFORE = """
+        SELECT id, title, body, author, created_at, updated_at
+        FROM threads
+        WHERE (updated_at, id) < (?, ?)
+        ORDER BY updated_at DESC, id DESC
+    """
+    _SQL_LIST_THREADS_BEFORE_LIMIT = _SQL_LIST_THREADS_BEFORE + " LIMIT ?"
+    # Same listings without body, so long bodies' overflow pages aren't read
+    _SQL_LIST_HEADERS = """
+        SELECT id, title, author, created_at, updated_at
+        FROM threads
+        ORDER BY updated_at DESC, id DESC
+    """
+    _SQL_LIST_HEADERS_LIMIT = _SQL_LIST_HEADERS + " LIMIT ?"
+    _SQL_LIST_HEADERS_BEFORE = """
+        SELECT id, title, author, created_at, updated_at
+        FROM threads
+        WHERE (updated_at, id) < (?, ?)
+        ORDER BY updated_at DESC, id DESC
+    """
+    _SQL_LIST_HEADERS_BEFORE_LIMIT = _SQL_LIST_HEADERS_BEFORE + " LIMIT ?"
+    # Thread row (kind 0) followed by its posts (kind 1) in one statement
+    _SQL_READ_THREAD = """
+        SELECT
+            0 AS kind,
+            id,
+            title,
+            body,
+            author,
+            created_at,
+            updated_at,
+            NULL AS quote_post_id,
+            NULL AS quoted_post_body
+        FROM threads
+        WHERE id = :thread_id
+        UNION ALL
+        SELECT
+            1,
+            p.id,
+            NULL,
+            p.body,
+            p.author,
+            p.created_at,
+            NULL,
+            p.quote_post_id,
+            q.body
+        FROM posts p
+        LEFT JOIN posts q ON p.quote_post_id = q.id
+        WHERE p.thread_id = :thread_id
+        ORDER BY kind, created_at, id
+    """
+    # Cheap validation tag for cached read_thread results
+    _SQL_THREAD_TAG = """
+        SELECT updated_at, (SELECT COUNT(*) FROM posts WHERE thread_id = :thread_id)
+        FROM threads
+        WHERE id = :thread_id
+    """
+    _SQL_SEARCH_FTS = """
+        SELECT t.id, t.title, t.body, t.author, t.created_at, t.updated_at
+        FROM threads t
+        JOIN threads_fts ON threads_fts.rowid = t.id
+        WHERE threads_fts MATCH :match
+        ORDER BY t.updated_at DESC
+    """
+    _SQL_SEARCH_FTS_LIMIT = _SQL_SEARCH_FTS + " LIMIT :limit"
+    # One specialized statement per (search_in, has_limit) combination
+    _SQL_SEARCH_LIKE = {
+        (search_in, has_limit): (
+            "SELECT id, title, body, author, created_at, updated_at FROM threads "
+            f"WHERE {where} ORDER BY updated_at DESC"
+            + (" LIMIT :limit" if has_limit else "")
+        )
+        for search_in, where in LIKE_SEARCH_CLAUSES.items()
+        for has_limit in (False, True)
+    }
+
+    def __init__(self, db_path: str | None = None, batch_writes: bool = False):
         """Initialize database connection.
 
+        A single write connection is opened here and shared by all write
+        methods behind a lock. Reads go through a per-thread, query-only
+        connection so that, with WAL, they run concurrently with each
+        other and with the writer. The instance can be shared across threads.
+
         Args:
-            db_path: Path to SQLite database file. If None, uses 'forum.db'
-                in current directory.
+            db_path: Path to SQLite database file. If None or empty, uses
+                'forum.db' next to this module (sqlite3 would otherwise open
+                a throwaway temporary database for "").
+            batch_writes: If True, writes go through a background writer
+                thread that commits concurrent writes together.
         """
-        if db_path is None:
+        if not db_path:
             db_path = os.path.join(os.path.dirname(__file__), "forum.db")
         self.db_path = db_path
+        self._lock = threading.RLock()
+        self._conn = self._connect()
+        # Separate connections to ":memory:" would be separate databases
+        self._shared_reads = db_path == ":memory:"
+        self._read_local = threading.local()
+        self._read_conns: list[sqlite3.Connection] = []
+        # Opened on the first checkpoint() (see there)
+        self._checkpoint_lock = threading.Lock()
+        self._checkpoint_conn: sqlite3.Connection | None = None
+        # Guards the result caches (never held while taking self._lock)
+        self._cache_lock = threading.Lock()
+        self._thread_cache_generation = 0
+        self._fts_enabled = False
+        # Bumped after every local write; with PRAGMA data_version (which
+        # changes on commits from other connections) it tags cached results
+        self._write_version = 0
+        self._list_cache: OrderedDict[
+            tuple[int | None, str | None, int | None],
+            tuple[tuple[int, int], list[dict[str, Any]]],
+        ] = OrderedDict()
+        self._thread_cache: OrderedDict[
+            int, tuple[tuple[Any, int, int], dict[str, Any]]
+        ] = OrderedDict()
         self._init_database()
+        self._write_queue = (
+            _WriteQueue(self._conn, self._lock) if batch_writes else None
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection in autocommit mode with tuned PRAGMAs."""
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+        )
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Run a block of statements in a single write transaction.
+
+        BEGIN IMMEDIATE takes the write lock up front, so concurrent writers
+        wait on busy_timeout instead of failing to upgrade a read lock.
+
+        Yields:
+            Cursor on the persistent connection
+        """
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+
+    def _write_sync(self, op: WriteOp) -> Any:
+        """Run a write operation and wait for its result.
+
+        Args:
+            op: Callable executed with a cursor inside a transaction
+
+        Returns:
+            The operation's return value
+        """
+
+        def versioned_op(cursor: sqlite3.Cursor) -> Any:
+            # Runs under the lock until COMMIT, so readers never pair the
+            # old version with the new contents
+            self._write_version += 1
+            return op(cursor)
+
+        if self._write_queue is not None:
+            return self._write_queue.submit(versioned_op).result()
+        with self._transaction() as cursor:
+            return versioned_op(cursor)
+
+    def _data_version(self) -> int:
+        """Get a counter that changes when another connection commits."""
+        with self._lock:
+            (data_version,) = self._conn.execute("PRAGMA data_version").fetchone()
+            return data_version
+
+    def _cache_tag(self) -> tuple[int, int]:
+        """Get a tag that changes whenever the database contents may have."""
+        with self._lock:
+            return (self._write_version, self._data_version())
+
+    def _invalidate_thread_cache(self) -> None:
+        """Drop all cached read_thread results.
+
+        Needed after deletes: ON DELETE SET NULL clears quotes of the
+        deleted posts in other threads without changing their tags.
+        """
+        with self._cache_lock:
+            self._thread_cache.clear()
+            self._thread_cache_generation += 1
+
+    def _reader(self) -> sqlite3.Connection:
+        """Get this thread's read-only connection, opening it on first use."""
+        conn = getattr(self._read_local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            conn.execute("PRAGMA query_only = ON")
+            self._read_local.conn = conn
+            with self._lock:
+                self._read_conns.append(conn)
+        return conn
+
+    def _fetch_tuples(self, sql: str, params: Any = ()) -> list[tuple]:
+        """Run a read query and return all rows as plain tuples."""
+        if self._shared_reads:
+            with self._lock:
+                return self._conn.execute(sql, params).fetchall()
+        return self._reader().execute(sql, params).fetchall()
+
+    def _fetch_tuples_timed(self, sql: str, params: Any, timeout: float) -> list[tuple]:
+        """Run a read query, aborting it once timeout seconds have passed.
+
+        Raises:
+            sqlite3.OperationalError: "interrupted" if the deadline passed
+        """
+        deadline = time.monotonic() + timeout
+
+        def fetch(conn: sqlite3.Connection) -> list[tuple]:
+            conn.set_progress_handler(
+                lambda: time.monotonic() > deadline, PROGRESS_HANDLER_OPS
+            )
+            try:
+                return conn.execute(sql, params).fetchall()
+            finally:
+                conn.set_progress_handler(None, 0)
+
+        if self._shared_reads:
+            with self._lock:
+                return fetch(self._conn)
+        return fetch(self._reader())
+
+    def __enter__(self) -> "ForumDatabase":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Flush pending writes and close all database connections."""
+        if self._write_queue is not None:
+            self._write_queue.close()
+        with self._checkpoint_lock:
+            if self._checkpoint_conn is not None:
+                self._checkpoint_conn.close()
+                self._checkpoint_conn = None
+        with self._lock:
+            for conn in self._read_conns:
+                conn.close()
+            self._read_conns.clear()
+            # Refresh planner statistics for the indexes queries have used
+            self._conn.execute("PRAGMA optimize")
+            self._conn.close()
 
     def _init_database(self):
         """Initialize database schema."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Enable foreign key constraints
-        cursor.execute("PRAGMA foreign_keys = ON")
+        with self._transaction() as cursor:
+            self._create_schema(cursor)
 
+    def _create_schema(self, cursor: sqlite3.Cursor) -> None:
+        """Create tables and indexes if they don't exist."""
         # Create threads table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS threads (
@@ -40,8 +560,12 @@ class ForumDatabase:
                 title TEXT NOT NULL,
                 body TEXT NOT NULL,
                 author TEXT NOT NULL,
-                created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+                created_at TIMESTAMP NOT NULL DEFAULT (
+                    CAST((julianday('now') - 2440587.5) * 86400000000 AS INTEGER)
+                ),
+                updated_at TIMESTAMP NOT NULL DEFAULT (
+                    CAST((julianday('now') - 2440587.5) * 86400000000 AS INTEGER)
+                )
             )
         """)
 
@@ -53,16 +577,18 @@ class ForumDatabase:
                 body TEXT NOT NULL,
                 author TEXT NOT NULL,
                 quote_post_id INTEGER,
-                created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                created_at TIMESTAMP NOT NULL DEFAULT (
+                    CAST((julianday('now') - 2440587.5) * 86400000000 AS INTEGER)
+                ),
                 FOREIGN KEY (thread_id) REFERENCES threads(id) ON DELETE CASCADE,
                 FOREIGN KEY (quote_post_id) REFERENCES posts(id) ON DELETE SET NULL
             )
         """)
 
-        # Create index for faster queries
+        # Create index for faster queries (in list order, for keyset paging)
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_threads_updated_at
-            ON threads(updated_at DESC)
+            CREATE INDEX IF NOT EXISTS idx_threads_updated_at_id
+            ON threads(updated_at DESC, id DESC)
         """)
 
         cursor.execute("""
@@ -70,8 +596,103 @@ class ForumDatabase:
             ON posts(thread_id)
         """)
 
-        conn.commit()
-        conn.close()
+        # Replying to a thread bumps its activity timestamp
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS posts_bump_thread
+            AFTER INSERT ON posts BEGIN
+                UPDATE threads SET updated_at = new.created_at
+                WHERE id = new.thread_id;
+            END
+        """)
+
+        self._fts_enabled = self._create_fts_index(cursor)
+
+        (user_version,) = cursor.execute("PRAGMA user_version").fetchone()
+        if user_version < 1:
+            self._migrate_iso_timestamps(cursor)
+        if user_version < 2:
+            # Superseded by idx_threads_updated_at_id
+            cursor.execute("DROP INDEX IF EXISTS idx_threads_updated_at")
+        if user_version < 3:
+            # Only served the removed exact-author lookup
+            cursor.execute("DROP INDEX IF EXISTS idx_threads_author_nocase")
+        if user_version < SCHEMA_VERSION:
+            cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _migrate_iso_timestamps(self, cursor: sqlite3.Cursor) -> None:
+        """Convert ISO-string timestamps from older databases to epoch microseconds.
+
+        The columns keep their TIMESTAMP declaration (NUMERIC affinity), so
+        integers are stored natively without rebuilding the tables.
+        """
+        for table, columns in (
+            ("threads", ("created_at", "updated_at")),
+            ("posts", ("created_at",)),
+        ):
+            for column in columns:
+                # CAST bypasses the TIMESTAMP converter so we see the raw text
+                rows = cursor.execute(
+                    f"SELECT id, CAST({column} AS TEXT) FROM {table} "
+                    f"WHERE typeof({column}) = 'text'"
+                ).fetchall()
+                cursor.executemany(
+                    f"UPDATE {table} SET {column} = ? WHERE id = ?",
+                    [
+                        (_to_epoch_us(datetime.fromisoformat(value)), row_id)
+                        for row_id, value in rows
+                    ],
+                )
+
+    def _create_fts_index(self, cursor: sqlite3.Cursor) -> bool:
+        """Create the FTS5 search index over threads, kept in sync by triggers.
+
+        Returns:
+            True if full-text search is available, False if this SQLite
+            build lacks FTS5 or the trigram tokenizer
+        """
+        existed = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'threads_fts'"
+        ).fetchone()
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS threads_fts USING fts5(
+                    title, body, author,
+                    content='threads', content_rowid='id',
+                    tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError:
+            return False
+
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS threads_fts_insert
+            AFTER INSERT ON threads BEGIN
+                INSERT INTO threads_fts(rowid, title, body, author)
+                VALUES (new.id, new.title, new.body, new.author);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS threads_fts_delete
+            AFTER DELETE ON threads BEGIN
+                INSERT INTO threads_fts(threads_fts, rowid, title, body, author)
+                VALUES ('delete', old.id, old.title, old.body, old.author);
+            END
+        """)
+        # Only indexed columns; updated_at bumps on every reply
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS threads_fts_update
+            AFTER UPDATE OF title, body, author ON threads BEGIN
+                INSERT INTO threads_fts(threads_fts, rowid, title, body, author)
+                VALUES ('delete', old.id, old.title, old.body, old.author);
+                INSERT INTO threads_fts(rowid, title, body, author)
+                VALUES (new.id, new.title, new.body, new.author);
+            END
+        """)
+
+        # Index threads created before the FTS table existed
+        if not existed:
+            cursor.execute("INSERT INTO threads_fts(threads_fts) VALUES ('rebuild')")
+        return True
 
     def create_thread(self, title: str, body: str, author: str) -> int:
         """Create a new thread.
@@ -84,73 +705,184 @@ class ForumDatabase:
         Returns:
             The ID of the created thread
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         # Use timezone-aware datetime (adapter registered at module level)
-        now = datetime.now(UTC)
-        cursor.execute(
-            """
-            INSERT INTO threads (title, body, author, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?)
-        """,
-            (title, body, author, now, now),
-        )
+        now = self._now()
+
+        def op(cursor: sqlite3.Cursor) -> int:
+            (thread_id,) = cursor.execute(
+                self._SQL_INSERT_THREAD, (title, body, author, now, now)
+            ).fetchone()
+            return thread_id
+
+        return self._write_sync(op)
+
+    def create_threads(self, rows: list[tuple[str, str, str]]) -> list[int]:
+        """Create several threads in a single transaction.
+
+        Intended for imports and seeding, where committing per thread would
+        cost one fsync per row.
+
+        Args:
+            rows: (title, body, author) tuples
+
+        Returns:
+            The IDs of the created threads, in the order of rows
+        """
 
-        thread_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        def op(cursor: sqlite3.Cursor) -> list[int]:
+            thread_ids = []
+            for title, body, author in rows:
+                now = self._now()
+                (thread_id,) = cursor.execute(
+                    self._SQL_INSERT_THREAD, (title, body, author, now, now)
+                ).fetchone()
+                thread_ids.append(thread_id)
+            return thread_ids
 
-        return thread_id
+        return self._write_sync(op)
 
-    def list_threads(self, limit: int | None = None) -> list[dict[str, Any]]:
-        """List threads sorted by recent activity (updated_at DESC).
+    def _list_thread_rows(
+        self,
+        limit: int | None,
+        before_updated_at: str | None,
+        before_id: int | None = None,
+        headers: bool = False,
+    ) -> list[tuple]:
+        """Fetch list_threads rows, optionally only those before a cursor.
+
+        With headers=True the rows leave out body (see list_thread_headers).
+        """
+        if headers:
+            sql, sql_limit = self._SQL_LIST_HEADERS, self._SQL_LIST_HEADERS_LIMIT
+            sql_before = self._SQL_LIST_HEADERS_BEFORE
+            sql_before_limit = self._SQL_LIST_HEADERS_BEFORE_LIMIT
+        else:
+            sql, sql_limit = self._SQL_LIST_THREADS, self._SQL_LIST_THREADS_LIMIT
+            sql_before = self._SQL_LIST_THREADS_BEFORE
+            sql_before_limit = self._SQL_LIST_THREADS_BEFORE_LIMIT
+
+        if before_updated_at is None:
+            if limit is not None:
+                return self._fetch_tuples(sql_limit, (limit,))
+            return self._fetch_tuples(sql)
+
+        before = _to_epoch_us(datetime.fromisoformat(before_updated_at))
+        # IDs start at 1, so without an ID every thread at before_updated_at
+        # is excluded too
+        params = (before, 0 if before_id is None else before_id)
+        if limit is not None:
+            return self._fetch_tuples(sql_before_limit, (*params, limit))
+        return self._fetch_tuples(sql_before, params)
+
+    def list_threads(
+        self,
+        limit: int | None = None,
+        before_updated_at: str | None = None,
+        before_id: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """List threads sorted by recent activity (updated_at DESC, id DESC).
 
         Args:
             limit: Optional limit on number of threads to return
+            before_updated_at: Optional keyset cursor; only threads after
+                (before_updated_at, before_id) in list order are returned.
+                Pass the updated_at and id of the last thread of a page
+            before_id: ID half of the cursor; if None, only threads with an
+                updated_at strictly older than before_updated_at are returned
 
         Returns:
             List of thread dictionaries with id, title, body, author,
-            created_at, updated_at
+            created_at, updated_at. Results are cached until the next write,
+            so the returned list is shared and must not be mutated.
+
+        Raises:
+            ValueError: If before_updated_at is not an ISO 8601 timestamp
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
-        cursor = conn.cursor()
-
-        query = """
-            SELECT id, title, body, author, created_at, updated_at
-            FROM threads
-            ORDER BY updated_at DESC
+        key = (limit, before_updated_at, before_id)
+        # The tag is taken before querying, so a concurrent write can only
+        # make the cached rows newer than their tag, never older
+        tag = self._cache_tag()
+        with self._cache_lock:
+            cached = self._list_cache.get(key)
+            if cached is not None and cached[0] == tag:
+                self._list_cache.move_to_end(key)
+                return cached[1]
+
+        threads = _thread_dicts(
+            self._list_thread_rows(limit, before_updated_at, before_id)
+        )
+
+        with self._cache_lock:
+            self._list_cache[key] = (tag, threads)
+            if len(self._list_cache) > LIST_CACHE_SIZE:
+                self._list_cache.popitem(last=False)
+        return threads
+
+    def list_threads_columnar(
+        self,
+        limit: int | None = None,
+        before_updated_at: str | None = None,
+        before_id: int | None = None,
+    ) -> dict[str, list[Any]]:
+        """List threads sorted by recent activity as column arrays.
+
+        Same rows as list_threads, but returned column-oriented
+        ({"id": [...], "title": [...], ...}) so large listings allocate six
+        lists instead of one dict per thread.
+
+        Args:
+            limit: Optional limit on number of threads to return
+            before_updated_at: Optional keyset cursor (see list_threads)
+            before_id: ID half of the cursor (see list_threads)
+
+        Returns:
+            Mapping of column name to list of values, in list_threads order
         """
+        return _thread_columns(
+            self._list_thread_rows(limit, before_updated_at, before_id)
+        )
 
-        if limit is not None:
-            query += " LIMIT ?"
-            cursor.execute(query, (limit,))
-        else:
-            cursor.execute(query)
-        rows = cursor.fetchall()
-
-        threads = []
-        for row in rows:
-            threads.append(
-                {
-                    "id": row["id"],
-                    "title": row["title"],
-                    "body": row["body"],
-                    "author": row["author"],
-                    "created_at": row["created_at"],
-                    "updated_at": row["updated_at"],
-                }
-            )
+    def list_thread_headers(
+        self,
+        limit: int | None = None,
+        before_updated_at: str | None = None,
+        before_id: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """List threads like list_threads, but without their bodies.
 
-        conn.close()
-        return threads
+        For thread lists that only show titles; long bodies are never read.
+
+        Args:
+            limit: Optional limit on number of threads to return
+            before_updated_at: Optional keyset cursor (see list_threads)
+            before_id: ID half of the cursor (see list_threads)
+
+        Returns:
+            List of thread dictionaries with id, title, author, created_at,
+            updated_at, in list_threads order
+
+        Raises:
+            ValueError: If before_updated_at is not an ISO 8601 timestamp
+        """
+        return [
+            {
+                "id": id_,
+                "title": title,
+                "author": author,
+                "created_at": created_at,
+                "updated_at": updated_at,
+            }
+            for id_, title, author, created_at, updated_at in self._list_thread_rows(
+                limit, before_updated_at, before_id, headers=True
+            )
+        ]
 
     def search_threads(
         self,
         query: str,
         search_in: str = "all",
         limit: int | None = None,
+        timeout: float | None = None,
     ) -> list[dict[str, Any]]:
         """Search threads by title, body, or author.
 
@@ -158,62 +890,33 @@ class ForumDatabase:
             query: Search query string (case-insensitive partial match)
             search_in: What to search in - "title", "body", "author", or "all" (default: "all")
             limit: Optional limit on number of threads to return
+            timeout: Optional time budget in seconds for the query
 
         Returns:
             List of thread dictionaries matching the search query, sorted by updated_at DESC
-        """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        # Build WHERE clause based on search_in parameter
-        search_pattern = f"%{query}%"
-        where_clauses = []
-
-        if search_in == "title":
-            where_clauses.append("title LIKE ?")
-            params = [search_pattern]
-        elif search_in == "body":
-            where_clauses.append("body LIKE ?")
-            params = [search_pattern]
-        elif search_in == "author":
-            where_clauses.append("author LIKE ?")
-            params = [search_pattern]
-        else:  # search_in == "all"
-            where_clauses.append("(title LIKE ? OR body LIKE ? OR author LIKE ?)")
-            params = [search_pattern, search_pattern, search_pattern]
-
-        where_clause = " AND ".join(where_clauses)
-
-        query_sql = f"""
-            SELECT id, title, body, author, created_at, updated_at
-            FROM threads
-            WHERE {where_clause}
-            ORDER BY updated_at DESC
-        """
 
-        if limit is not None:
-            query_sql += " LIMIT ?"
-            params.append(limit)
-
-        cursor.execute(query_sql, params)
-        rows = cursor.fetchall()
-
-        threads = []
-        for row in rows:
-            threads.append(
-                {
-                    "id": row["id"],
-                    "title": row["title"],
-                    "body": row["body"],
-                    "author": row["author"],
-                    "created_at": row["created_at"],
-                    "updated_at": row["updated_at"],
-                }
+        Raises:
+            sqlite3.OperationalError: "interrupted" if timeout was exceeded
+        """
+        if search_in not in LIKE_SEARCH_CLAUSES:
+            search_in = "all"
+
+        if self._fts_enabled and len(query) >= FTS_MIN_QUERY_LENGTH:
+            # Quote the query as a single FTS5 phrase (escape embedded quotes)
+            params = {
+                "match": FTS_COLUMN_FILTERS[search_in] + query.replace('"', '""') + '"',
+                "limit": limit,
+            }
+            query_sql = (
+                self._SQL_SEARCH_FTS if limit is None else self._SQL_SEARCH_FTS_LIMIT
             )
+        else:
+            params = {"pattern": f"%{query}%", "limit": limit}
+            query_sql = self._SQL_SEARCH_LIKE[search_in, limit is not None]
 
-        conn.close()
-        return threads
+        if timeout is not None:
+            return _thread_dicts(self._fetch_tuples_timed(query_sql, params, timeout))
+        return _thread_dicts(self._fetch_tuples(query_sql, params))
 
     def create_post(
         self, thread_id: int, body: str, author: str, quote_post_id: int | None = None
@@ -233,40 +936,17 @@ class ForumDatabase:
             sqlite3.IntegrityError: If thread_id doesn't exist \
                 or quote_post_id is invalid
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Enable foreign key constraints
-        cursor.execute("PRAGMA foreign_keys = ON")
-
         # Use timezone-aware datetime (adapter registered at module level)
-        now = datetime.now(UTC)
-
-        # Create the post
-        cursor.execute(
-            """
-            INSERT INTO posts (thread_id, body, author, quote_post_id, created_at)
-            VALUES (?, ?, ?, ?, ?)
-        """,
-            (thread_id, body, author, quote_post_id, now),
-        )
-
-        post_id = cursor.lastrowid
-
-        # Update thread's updated_at timestamp
-        cursor.execute(
-            """
-            UPDATE threads
-            SET updated_at = ?
-            WHERE id = ?
-        """,
-            (now, thread_id),
-        )
+        now = self._now()
 
-        conn.commit()
-        conn.close()
+        def op(cursor: sqlite3.Cursor) -> int:
+            # Create the post; a trigger bumps the thread's updated_at
+            (post_id,) = cursor.execute(
+                self._SQL_INSERT_POST, (thread_id, body, author, quote_post_id, now)
+            ).fetchone()
+            return post_id
 
-        return post_id
+        return self._write_sync(op)
 
     def read_thread(self, thread_id: int) -> dict[str, Any] | None:
         """Read a thread with all its posts in order.
@@ -275,76 +955,43 @@ class ForumDatabase:
             thread_id: The ID of the thread to read
 
         Returns:
-            Dictionary with thread info and posts list, or None if thread doesn't exist
+            Dictionary with thread info and posts list, or None if thread doesn't exist.
+            Results are cached per thread until its updated_at or post count
+            changes, a local delete, or a commit from another connection, so
+            the returned dict is shared and must not be mutated.
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        # Get thread information
-        cursor.execute(
-            """
-            SELECT id, title, body, author, created_at, updated_at
-            FROM threads
-            WHERE id = ?
-        """,
-            (thread_id,),
-        )
-        thread_row = cursor.fetchone()
-
-        if thread_row is None:
-            conn.close()
+        params = {"thread_id": thread_id}
+        # Taken before reading, so a concurrent commit can only make cached
+        # rows newer than their tag
+        data_version = self._data_version()
+        tag_row = self._fetch_tuples(self._SQL_THREAD_TAG, params)
+        with self._cache_lock:
+            if not tag_row:
+                self._thread_cache.pop(thread_id, None)
+                return None
+
+            tag = (*tag_row[0], data_version)
+            cached = self._thread_cache.get(thread_id)
+            if cached is not None and cached[0] == tag:
+                self._thread_cache.move_to_end(thread_id)
+                return cached[1]
+            generation = self._thread_cache_generation
+
+        # Thread row first, then all posts with quoted post body (if any),
+        # ordered by created_at (oldest first)
+        rows = self._fetch_tuples(self._SQL_READ_THREAD, params)
+
+        if not rows or rows[0][0] != 0:  # First column is kind
             return None
 
-        # Get all posts for this thread with quoted post body (if any), ordered by created_at (oldest first)
-        cursor.execute(
-            """
-            SELECT
-                p.id,
-                p.thread_id,
-                p.body,
-                p.author,
-                p.quote_post_id,
-                p.created_at,
-                q.body AS quoted_post_body
-            FROM posts p
-            LEFT JOIN posts q ON p.quote_post_id = q.id
-            WHERE p.thread_id = ?
-            ORDER BY p.created_at ASC
-        """,
-            (thread_id,),
-        )
-        post_rows = cursor.fetchall()
-
-        # Build thread dictionary
-        thread = {
-            "id": thread_row["id"],
-            "title": thread_row["title"],
-            "body": thread_row["body"],
-            "author": thread_row["author"],
-            "created_at": thread_row["created_at"],
-            "updated_at": thread_row["updated_at"],
-        }
-
-        # Build posts list
-        posts = []
-        for post_row in post_rows:
-            post_dict = {
-                "id": post_row["id"],
-                "thread_id": post_row["thread_id"],
-                "body": post_row["body"],
-                "author": post_row["author"],
-                "quote_post_id": post_row["quote_post_id"],
-                "created_at": post_row["created_at"],
-            }
-            # Include quoted post body if this post quotes another post
-            if post_row["quote_post_id"] is not None:
-                post_dict["quoted_post_body"] = post_row["quoted_post_body"]
-            posts.append(post_dict)
-
-        conn.close()
-
-        return {"thread": thread, "posts": posts}
+        result = _build_thread_result(thread_id, rows)
+        with self._cache_lock:
+            # Skip caching if posts were deleted while we were reading
+            if generation == self._thread_cache_generation:
+                self._thread_cache[thread_id] = (tag, result)
+                if len(self._thread_cache) > THREAD_CACHE_SIZE:
+                    self._thread_cache.popitem(last=False)
+        return result
 
     def delete_post(self, post_id: int) -> bool:
         """Delete a post by ID.
@@ -355,24 +1002,16 @@ class ForumDatabase:
         Returns:
             True if post was deleted, False if post doesn't exist
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
 
-        # Enable foreign key constraints
-        cursor.execute("PRAGMA foreign_keys = ON")
+        def op(cursor: sqlite3.Cursor) -> bool:
+            # Delete the post; rowcount is 0 if it doesn't exist
+            cursor.execute("DELETE FROM posts WHERE id = ?", (post_id,))
+            return cursor.rowcount > 0
 
-        # Check if post exists
-        cursor.execute("SELECT id FROM posts WHERE id = ?", (post_id,))
-        if cursor.fetchone() is None:
-            conn.close()
-            return False
-
-        # Delete the post
-        cursor.execute("DELETE FROM posts WHERE id = ?", (post_id,))
-        conn.commit()
-        conn.close()
-
-        return True
+        deleted = self._write_sync(op)
+        if deleted:
+            self._invalidate_thread_cache()
+        return deleted
 
     def delete_thread(self, thread_id: int) -> bool:
         """Delete a thread by ID (cascades to delete all posts in the thread).
@@ -383,25 +1022,68 @@ class ForumDatabase:
         Returns:
             True if thread was deleted, False if thread doesn't exist
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
 
-        # Enable foreign key constraints
-        cursor.execute("PRAGMA foreign_keys = ON")
+        def op(cursor: sqlite3.Cursor) -> bool:
+            # Delete the thread (cascades to delete all posts); rowcount is 0 if it doesn't exist
+            cursor.execute("DELETE FROM threads WHERE id = ?", (thread_id,))
+            return cursor.rowcount > 0
 
-        # Check if thread exists
-        cursor.execute("SELECT id FROM threads WHERE id = ?", (thread_id,))
-        if cursor.fetchone() is None:
-            conn.close()
-            return False
+        deleted = self._write_sync(op)
+        if deleted:
+            # Its posts may have been quoted from other threads
+            self._invalidate_thread_cache()
+        return deleted
 
-        # Delete the thread (cascades to delete all posts)
-        cursor.execute("DELETE FROM threads WHERE id = ?", (thread_id,))
-        conn.commit()
-        conn.close()
+    def delete_threads(self, thread_ids: list[int]) -> int:
+        """Delete several threads in a single transaction.
 
-        return True
+        Args:
+            thread_ids: The IDs of the threads to delete
 
-    def get_connection(self):
-        """Get a database connection."""
-        return sqlite3.connect(self.db_path)
+        Returns:
+            Number of threads deleted (IDs that don't exist are skipped)
+        """
+        params = [(thread_id,) for thread_id in dict.fromkeys(thread_ids)]
+
+        def op(cursor: sqlite3.Cursor) -> int:
+            # Deletes cascade to posts; rowcount only counts thread rows
+            cursor.executemany("DELETE FROM threads WHERE id = ?", params)
+            return cursor.rowcount
+
+        deleted = self._write_sync(op)
+        if deleted:
+            self._invalidate_thread_cache()
+        return deleted
+
+    def checkpoint(self) -> tuple[int, int, int]:
+        """Copy the WAL into the database file and truncate it.
+
+        Bounds WAL growth under sustained writes, which would otherwise make
+        readers scan an ever longer log. Runs on its own connection with a
+        short busy timeout and without self._lock, so a busy database makes
+        the checkpoint give up early rather than stall reads and writes.
+
+        Returns:
+            (busy, wal_frames, checkpointed_frames) as reported by
+            PRAGMA wal_checkpoint; busy is 1 if a reader or writer blocked
+            completion
+        """
+        with self._checkpoint_lock:
+            if self._checkpoint_conn is None:
+                self._checkpoint_conn = self._connect()
+                self._checkpoint_conn.execute(
+                    f"PRAGMA busy_timeout = {CHECKPOINT_BUSY_TIMEOUT_MS}"
+                )
+            return self._checkpoint_conn.execute(
+                "PRAGMA wal_checkpoint(TRUNCATE)"
+            ).fetchone()
+
+    def get_connection(self) -> sqlite3.Connection:
+        """Get a new database connection.
+
+        The connection is configured like the persistent one (foreign keys,
+        WAL PRAGMAs, TIMESTAMP conversion), so callers don't need to issue
+        PRAGMA foreign_keys themselves. The caller is responsible for
+        closing it.
+        """
+        return self._connect()
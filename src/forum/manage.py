@@ -14,10 +14,10 @@ def cli(ctx: click.Context) -> None:
 
     Manage threads, posts, and other forum data.
     """
-    # Initialize database and pass to subcommands
+    # Initialize database and pass to subcommands; closed when the CLI exits
     db_path = os.environ.get("FORUM_DB_PATH")
     ctx.ensure_object(dict)
-    ctx.obj["db"] = ForumDatabase(db_path=db_path)
+    ctx.obj["db"] = ctx.with_resource(ForumDatabase(db_path=db_path))
 
 
 @cli.command
@@ -58,27 +58,43 @@ def post(ctx: click.Context, delete: int) -> None:
     "--delete",
     type=int,
     required=True,
-    help="Thread ID to delete",
+    multiple=True,
+    help="Thread ID to delete (repeat to delete several)",
 )
 @click.pass_context
-def thread(ctx: click.Context, delete: int) -> None:
+def thread(ctx: click.Context, delete: tuple[int, ...]) -> None:
     """Manage threads.
 
     Examples:
         forum-manage thread --delete 3
-        forum-manage thread -d 3
+        forum-manage thread -d 3 -d 4 -d 7
     """
     db = ctx.obj["db"]
 
-    if delete:
-        if db.delete_thread(delete):
+    if len(delete) == 1:
+        if db.delete_thread(delete[0]):
+            click.secho(
+                f"✓ Thread {delete[0]} deleted successfully",
+                fg="green",
+            )
+        else:
+            click.secho(
+                f"✗ Thread {delete[0]} not found",
+                fg="red",
+            )
+            raise click.Exit(1)
+    elif delete:
+        requested = len(set(delete))
+        deleted = db.delete_threads(list(delete))
+        if deleted == requested:
             click.secho(
-                f"✓ Thread {delete} deleted successfully",
+                f"✓ {deleted} threads deleted successfully",
                 fg="green",
             )
         else:
             click.secho(
-                f"✗ Thread {delete} not found",
+                f"✗ {deleted} of {requested} threads deleted "
+                f"({requested - deleted} not found)",
                 fg="red",
             )
             raise click.Exit(1)
@@ -1,19 +1,41 @@
 """Forum MCP Server for LLM agent collaboration."""
 
 import argparse
+import functools
+import math
 import os
 import sqlite3
+import threading
+import time
 
 from fastmcp import FastMCP
 
-from database import ForumDatabase
+from database import LIKE_SEARCH_CLAUSES, ForumDatabase
 
 # Initialize FastMCP server
 mcp = FastMCP(name="forum")
 
 # Initialize database
+# Resolved once at import; ForumDatabase treats unset or empty as the default
 _db_path = os.environ.get("FORUM_DB_PATH")
-db = ForumDatabase(db_path=_db_path)
+_batch_writes = os.environ.get("FORUM_BATCH_WRITES", "false").lower() == "true"
+db = ForumDatabase(db_path=_db_path, batch_writes=_batch_writes)
+
+# Default seconds between WAL-truncating checkpoints while serving
+# (FORUM_CHECKPOINT_INTERVAL, read at startup; 0 or less disables)
+_DEFAULT_CHECKPOINT_INTERVAL = 60.0
+
+# Default time budget for one search query; slower searches are aborted
+# (FORUM_SEARCH_TIMEOUT; 0 or less disables)
+_DEFAULT_SEARCH_TIMEOUT = 0.5
+
+# Errors the tools report as {"success": False, "error": ...}: database
+# failures and bad arguments (a malformed cursor or non-UTF-8 text raises
+# ValueError, an integer too large for SQLite raises OverflowError)
+_TOOL_ERRORS = (sqlite3.Error, ValueError, OverflowError)
+
+# Valid search_in values are the keys of the database's per-column SQL table
+_INVALID_SEARCH_IN_ERROR = f"search_in must be one of: {', '.join(LIKE_SEARCH_CLAUSES)}"
 
 
 def _create_thread_impl(
@@ -37,24 +59,84 @@ def _create_thread_impl(
             "thread_id": thread_id,
             "message": f"Thread '{title}' created successfully by {author}",
         }
-    except Exception as e:
+    except _TOOL_ERRORS as e:
         return {"success": False, "error": str(e)}
 
 
-def _list_threads_impl(database: ForumDatabase, limit: int = 50) -> dict:
+def _encode_cursor(updated_at: str, thread_id: int) -> str:
+    """Build the next_cursor for a page ending at this thread."""
+    return f"{updated_at}#{thread_id}"
+
+
+def _decode_cursor(cursor: str) -> tuple[str, int | None]:
+    """Split a next_cursor into (updated_at, id).
+
+    A bare timestamp (no "#id") is accepted and pages strictly before it.
+
+    Raises:
+        ValueError: If the ID part is not an integer
+    """
+    updated_at, sep, thread_id = cursor.rpartition("#")
+    if not sep:
+        return cursor, None
+    return updated_at, int(thread_id)
+
+
+def _list_threads_impl(
+    database: ForumDatabase,
+    limit: int = 50,
+    columnar: bool = False,
+    cursor: str | None = None,
+) -> dict:
     """Implementation of list_threads tool.
 
     Args:
         database: The database instance to use
         limit: Maximum number of threads to return (default: 50)
+        columnar: Return {"columns": {"id": [...], ...}} instead of a
+            list of thread objects (default: False)
+        cursor: next_cursor from a previous page; only threads after it in
+            list order are returned (default: None, first page)
 
     Returns:
-        A dictionary with success status and list of threads
+        A dictionary with success status, list of threads and next_cursor
+        (None when there are no more pages)
     """
     try:
-        threads = database.list_threads(limit=limit)
-        return {"success": True, "threads": threads, "count": len(threads)}
-    except Exception as e:
+        before_updated_at, before_id = (
+            _decode_cursor(cursor) if cursor is not None else (None, None)
+        )
+        if columnar:
+            columns = database.list_threads_columnar(
+                limit=limit, before_updated_at=before_updated_at, before_id=before_id
+            )
+            updated = columns["updated_at"]
+            next_cursor = (
+                _encode_cursor(updated[-1], columns["id"][-1])
+                if updated and len(updated) == limit
+                else None
+            )
+            return {
+                "success": True,
+                "columns": columns,
+                "count": len(updated),
+                "next_cursor": next_cursor,
+            }
+        threads = database.list_threads(
+            limit=limit, before_updated_at=before_updated_at, before_id=before_id
+        )
+        next_cursor = (
+            _encode_cursor(threads[-1]["updated_at"], threads[-1]["id"])
+            if threads and len(threads) == limit
+            else None
+        )
+        return {
+            "success": True,
+            "threads": threads,
+            "count": len(threads),
+            "next_cursor": next_cursor,
+        }
+    except _TOOL_ERRORS as e:
         return {"success": False, "error": str(e)}
 
 
@@ -95,7 +177,7 @@ def _reply_to_thread_impl(
             "success": False,
             "error": f"Thread {thread_id} does not exist or quote_post_id is invalid",
         }
-    except Exception as e:
+    except _TOOL_ERRORS as e:
         return {"success": False, "error": str(e)}
 
 
@@ -122,7 +204,7 @@ def _read_thread_impl(database: ForumDatabase, thread_id: int) -> dict:
             "posts": result["posts"],
             "post_count": len(result["posts"]),
         }
-    except Exception as e:
+    except _TOOL_ERRORS as e:
         return {"success": False, "error": str(e)}
 
 
@@ -143,19 +225,100 @@ def _search_threads_impl(
     Returns:
         A dictionary with success status and list of matching threads
     """
+    if search_in not in LIKE_SEARCH_CLAUSES:
+        return {"success": False, "error": _INVALID_SEARCH_IN_ERROR}
+
     try:
-        # Validate search_in parameter
-        valid_search_in = ["title", "body", "author", "all"]
-        if search_in not in valid_search_in:
-            return {
-                "success": False,
-                "error": f"search_in must be one of: {', '.join(valid_search_in)}",
-            }
+        if query:
+            threads = database.search_threads(
+                query=query,
+                search_in=search_in,
+                limit=limit,
+                timeout=_search_timeout(),
+            )
+        else:
+            # An empty pattern matches every thread: serve it from the
+            # updated_at index (and list cache) instead of a LIKE scan
+            threads = database.list_threads(limit=limit)
+        return {
+            "success": True,
+            "threads": threads,
+            "count": len(threads),
+            "query": query,
+        }
+    except _TOOL_ERRORS as e:
+        # "interrupted" means the query ran past _search_timeout()
+        error = "search timed out" if str(e) == "interrupted" else str(e)
+        return {"success": False, "error": error}
 
-        threads = database.search_threads(query=query, search_in=search_in, limit=limit)
-        return {"success": True, "threads": threads, "count": len(threads), "query": query}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+
+def _env_seconds(name: str, default: float) -> float:
+    """Read a number of seconds from an environment variable.
+
+    Args:
+        name: Environment variable to read
+        default: Value used when the variable is unset or empty
+
+    Raises:
+        ValueError: If the variable is set but not a finite number
+    """
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        value = math.nan
+    if not math.isfinite(value):
+        raise ValueError(f"{name} must be a number of seconds, got {raw!r}")
+    return value
+
+
+@functools.cache
+def _search_timeout() -> float | None:
+    """Get the search time budget from FORUM_SEARCH_TIMEOUT, or None if disabled.
+
+    Read once; call _search_timeout.cache_clear() to pick up a change.
+    """
+    timeout = _env_seconds("FORUM_SEARCH_TIMEOUT", _DEFAULT_SEARCH_TIMEOUT)
+    return timeout if timeout > 0 else None
+
+
+def _start_checkpointer(
+    database: ForumDatabase, interval: float
+) -> threading.Thread | None:
+    """Start a daemon thread that checkpoints the WAL every interval seconds.
+
+    SQLite's automatic checkpoints never shrink the WAL file; a periodic
+    TRUNCATE checkpoint keeps it small so reads stay fast under write load.
+
+    Args:
+        database: The database instance to checkpoint
+        interval: Seconds between checkpoints; 0 or less disables them
+
+    Returns:
+        The started thread, or None if disabled
+    """
+    if interval <= 0:
+        return None
+
+    def run() -> None:
+        while True:
+            time.sleep(interval)
+            try:
+                database.checkpoint()
+            except sqlite3.Error:
+                pass  # Retried on the next tick
+
+    thread = threading.Thread(target=run, name="forum-wal-checkpoint", daemon=True)
+    thread.start()
+    return thread
+
+
+# The tools below are thin wrappers rather than functools.partial(impl, db):
+# FastMCP only registers plain functions, and builds each tool's name, input
+# schema and description from the wrapper's own signature and docstring.
+# The extra frame per call is negligible next to the SQLite work.
 
 
 @mcp.tool
@@ -174,16 +337,24 @@ def create_thread(title: str, body: str, author: str) -> dict:
 
 
 @mcp.tool
-def list_threads(limit: int = 50) -> dict:
+def list_threads(
+    limit: int = 50, columnar: bool = False, cursor: str | None = None
+) -> dict:
     """List threads sorted by recent activity.
 
     Args:
         limit: Maximum number of threads to return (default: 50)
+        columnar: Return column arrays ({"columns": {"id": [...], "title": [...], ...}})
+            instead of a list of thread objects; more compact for large listings
+            (default: False)
+        cursor: Pass the next_cursor of the previous response to fetch the
+            next page of older threads (default: None, first page)
 
     Returns:
-        A dictionary with success status and list of threads
+        A dictionary with success status, list of threads and next_cursor
+        (None when there are no more pages)
     """
-    return _list_threads_impl(db, limit)
+    return _list_threads_impl(db, limit, columnar, cursor)
 
 
 @mcp.tool
@@ -234,6 +405,10 @@ def search_threads(query: str, search_in: str = "all", limit: int = 50) -> dict:
 
 def run_stdio():
     """Run the MCP server in stdio mode (for testing and local development)."""
+    _search_timeout()  # Fail at startup on a malformed value
+    _start_checkpointer(
+        db, _env_seconds("FORUM_CHECKPOINT_INTERVAL", _DEFAULT_CHECKPOINT_INTERVAL)
+    )
     mcp.run(transport="stdio")
 
 
@@ -254,6 +429,10 @@ def run_http(
     host = host or os.environ.get("FORUM_HOST", "0.0.0.0")
     port = port or int(os.environ.get("FORUM_PORT", "8000"))
     transport = "sse" if streamable else "http"
+    _search_timeout()  # Fail at startup on a malformed value
+    _start_checkpointer(
+        db, _env_seconds("FORUM_CHECKPOINT_INTERVAL", _DEFAULT_CHECKPOINT_INTERVAL)
+    )
     mcp.run(
         transport=transport,
         host=host,
@@ -1,12 +1,22 @@
 #!/usr/bin/env python3
 """Colorful Textual CLI viewer for forum threads - fun interface for browsing discussions."""
 
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
+from operator import itemgetter
+from typing import TypeVar
 
+from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
+from textual.coordinate import Coordinate
+from textual.message import Message
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widgets import (
     Button,
     DataTable,
@@ -18,6 +28,38 @@ from textual.widgets import (
 
 from database import ForumDatabase
 
+T = TypeVar("T")
+
+# Threads fetched per page of the thread list
+THREAD_PAGE_SIZE = 50
+
+_HELP_TEXT = (
+    "🆘 FORUM EXPLORER HELP\n\n"
+    "Controls:\n"
+    "  • Click threads to view details\n"
+    "  • Search using the search bar\n"
+    "  • 'All Threads' shows recent threads\n"
+    "  • Press ⬅️ Back to return to list\n\n"
+    "Keyboard:\n"
+    "  L - List threads\n"
+    "  R - Refresh current view\n"
+    "  N - Create new thread\n"
+    "  P - Reply to current thread\n"
+    "  Q - Quit application\n"
+    "  ? - Show this help\n\n"
+    "Features:\n"
+    "  ✨ View all forum threads\n"
+    "  🔍 Search by title/author/content\n"
+    "  📌 Read full thread discussions\n"
+    "  💬 See post quotes and replies\n"
+    "  📝 Create new threads\n"
+    "  💬 Reply to discussions"
+)
+
+# Fields read from ForumDatabase thread and post dicts, which always have them
+_THREAD_ROW_FIELDS = itemgetter("id", "title", "author", "updated_at")
+_POST_CARD_FIELDS = itemgetter("id", "author", "body", "created_at")
+
 
 class NewThreadScreen(ModalScreen[dict | None]):
     """Modal screen for creating a new thread."""
@@ -78,11 +120,14 @@ class NewThreadScreen(ModalScreen[dict | None]):
         with Vertical(id="new-thread-dialog"):
             yield Static("📝 Create New Thread", classes="dialog-title")
             yield Label("Author:")
-            yield Input(placeholder="Your name...", id="author-input")
+            self.author_input = Input(placeholder="Your name...", id="author-input")
+            yield self.author_input
             yield Label("Title:")
-            yield Input(placeholder="Thread title...", id="title-input")
+            self.title_input = Input(placeholder="Thread title...", id="title-input")
+            yield self.title_input
             yield Label("Body:")
-            yield TextArea(id="body-input")
+            self.body_input = TextArea(id="body-input")
+            yield self.body_input
             with Horizontal(classes="button-row"):
                 yield Button("✅ Create", id="create-btn", variant="success")
                 yield Button("❌ Cancel", id="cancel-btn", variant="error")
@@ -94,11 +139,11 @@ class NewThreadScreen(ModalScreen[dict | None]):
             self.action_cancel()
 
     def action_submit(self) -> None:
-        author = self.query_one("#author-input", Input).value.strip()
-        title = self.query_one("#title-input", Input).value.strip()
-        body = self.query_one("#body-input", TextArea).text.strip()
+        author = self.author_input.value.strip()
+        title = self.title_input.value.strip()
+        body = self.body_input.text.strip()
 
-        if not author or not title or not body:
+        if not (author and title and body):
             return  # Don't submit if fields are empty
 
         self.dismiss({"author": author, "title": title, "body": body})
@@ -179,9 +224,11 @@ class ReplyScreen(ModalScreen[dict | None]):
             yield Static("💬 Reply to Thread", classes="dialog-title")
             yield Static(f"📌 {self.thread_title[:50]}", classes="thread-context")
             yield Label("Author:")
-            yield Input(placeholder="Your name...", id="author-input")
+            self.author_input = Input(placeholder="Your name...", id="author-input")
+            yield self.author_input
             yield Label("Reply:")
-            yield TextArea(id="body-input")
+            self.body_input = TextArea(id="body-input")
+            yield self.body_input
             with Horizontal(classes="button-row"):
                 yield Button("✅ Post Reply", id="submit-reply-btn", variant="success")
                 yield Button("❌ Cancel", id="cancel-reply-btn", variant="error")
@@ -193,10 +240,10 @@ class ReplyScreen(ModalScreen[dict | None]):
             self.action_cancel()
 
     def action_submit(self) -> None:
-        author = self.query_one("#author-input", Input).value.strip()
-        body = self.query_one("#body-input", TextArea).text.strip()
+        author = self.author_input.value.strip()
+        body = self.body_input.text.strip()
 
-        if not author or not body:
+        if not (author and body):
             return  # Don't submit if fields are empty
 
         self.dismiss({"author": author, "body": body, "thread_id": self.thread_id})
@@ -205,6 +252,22 @@ class ReplyScreen(ModalScreen[dict | None]):
         self.dismiss(None)
 
 
+@lru_cache(maxsize=2048)
+def _fmt_ts(ts: str, fmt: str, fallback: str | None = None) -> str:
+    """Format an ISO timestamp for display.
+
+    Unparseable values come back as ``fallback``, or unchanged if it is None.
+    """
+    try:
+        return datetime.fromisoformat(ts).strftime(fmt)
+    except (ValueError, TypeError):
+        return ts if fallback is None else fallback
+
+
+# Posts longer than this are truncated until expanded
+POST_PREVIEW_CHARS = 4000
+
+
 class PostCard(Static):
     """A widget representing a single forum post."""
 
@@ -221,7 +284,14 @@ class PostCard(Static):
     ):
         super().__init__(**kwargs)
         self.author = author
-        self.body = body
+        # Long bodies are shown as a preview until expanded, so unrelated
+        # repaints don't re-wrap the whole text
+        self._full_body = body
+        if len(body) > POST_PREVIEW_CHARS:
+            self.body = body[:POST_PREVIEW_CHARS] + "\n…(truncated, press e to expand)"
+            self.can_focus = True
+        else:
+            self.body = body
         self.timestamp = timestamp
         self.is_original = is_original
         self.post_number = post_number
@@ -236,27 +306,117 @@ class PostCard(Static):
         else:
             self.add_class("reply")
 
+    def key_e(self) -> None:
+        """Expand a truncated post to its full body."""
+        if self.body is not self._full_body:
+            self.body = self._full_body
+            self.can_focus = False
+            self.refresh(layout=True)
+
     def render(self) -> str:
         """Render the post content."""
-        if self.is_original:
-            header = "[b]📝 Original Post[/b]"
-        else:
-            header = f"[b]💬 Reply #{self.post_number}[/b]"
-            if self.post_id is not None:
-                header += f" (ID: {self.post_id})"
-
-        lines = [
-            header,
-            f"[green]✍️ {self.author}[/green] [dim]@ {self.timestamp}[/dim]",
-            "─" * 60,
+        return _render_post(
+            self.is_original,
+            self.post_number,
+            self.post_id,
+            self.author,
+            self.timestamp,
             self.body,
-        ]
+            self.quoted_text,
+        )
+
+
+_SEPARATOR = "─" * 60
+
+
+# A few pages of cards; cleared when another thread is opened
+@lru_cache(maxsize=128)
+def _render_post(
+    is_original: bool,
+    post_number: int | None,
+    post_id: int | None,
+    author: str,
+    timestamp: str,
+    body: str,
+    quoted_text: str | None,
+) -> str:
+    """Build the markup for a PostCard; cached because posts never change."""
+    if is_original:
+        header = "[b]📝 Original Post[/b]"
+    else:
+        header = f"[b]💬 Reply #{post_number}[/b]"
+        if post_id is not None:
+            header += f" (ID: {post_id})"
+
+    text = f"{header}\n[green]✍️ {author}[/green] [dim]@ {timestamp}[/dim]\n{_SEPARATOR}\n{body}"
+    if quoted_text:
+        text += f"\n\n[dim italic]📌 Quoting: {quoted_text[:80]}...[/dim italic]"
+    return text
+
+
+class PostScroll(VerticalScroll):
+    """Scrollable post list that mounts cards a page at a time.
+
+    Cards are built on demand from an index, so opening a long thread
+    only mounts the first page; the next page is mounted when the user
+    scrolls near the bottom.
+    """
+
+    PAGE_SIZE = 25
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._make_card: Callable[[int], PostCard] | None = None
+        self._total = 0
+        self._mounted = 0
+        self._mounting = False
+
+    async def show(self, make_card: Callable[[int], PostCard], total: int) -> None:
+        """Replace the list with ``total`` cards produced by ``make_card(index)``."""
+        await self.remove_children()
+        self.scroll_home(animate=False)
+        self._make_card = make_card
+        self._total = total
+        self._mounted = 0
+        await self.mount_more()
+
+    async def extend(self, make_card: Callable[[int], PostCard], total: int) -> None:
+        """Grow the list to ``total`` cards, keeping the ones already mounted."""
+        caught_up = self._mounted >= self._total
+        self._make_card = make_card
+        self._total = total
+        if caught_up:
+            await self.mount_more()
+
+    async def mount_more(self) -> None:
+        """Mount the next page of cards, if any are left."""
+        if self._mounting or self._make_card is None or self._mounted >= self._total:
+            return
+        self._mounting = True
+        try:
+            end = min(self._mounted + self.PAGE_SIZE, self._total)
+            cards = [self._make_card(i) for i in range(self._mounted, end)]
+            self._mounted = end
+            await self.mount_all(cards)
+        finally:
+            self._mounting = False
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        if new_value >= self.max_scroll_y - self.size.height:
+            self.call_after_refresh(self.mount_more)
 
-        if self.quoted_text:
-            lines.append("")
-            lines.append(f"[dim italic]📌 Quoting: {self.quoted_text[:80]}...[/dim italic]")
 
-        return "\n".join(lines)
+class ThreadTable(DataTable):
+    """Thread list table that reports when it is scrolled near the end."""
+
+    class NearEnd(Message):
+        """Posted when the table is scrolled to within a screen of its end."""
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        if new_value > old_value and new_value >= self.max_scroll_y - self.size.height:
+            self.post_message(self.NearEnd())
 
 
 class ForumHeader(Static):
@@ -360,6 +520,10 @@ class ForumViewer(App):
         margin-left: 2;
     }
 
+    .post-card:focus {
+        border: solid $warning;
+    }
+
     .post-author {
         color: $success;
         text-style: bold;
@@ -428,15 +592,35 @@ class ForumViewer(App):
         Binding("?", "help", "Help", show=True),
     ]
 
+    # Seconds to wait after the last keystroke before searching
+    SEARCH_DEBOUNCE = 0.15
+
     def __init__(self):
         super().__init__()
         self.db = ForumDatabase()
+        # A single thread keeps database calls off the event loop while
+        # reusing one read connection
+        self._db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="forum-db")
         self.threads = []
         self.current_thread = None
+        self.current_posts = []
+        self._header_prefix_cache: dict[int, str] = {}
+        # (thread_id, post count, last post ID) of the thread in posts_scroll
+        self._shown_thread_sig: tuple[int, int, int | None] | None = None
+        self._search_timer: Timer | None = None
+        self._displayed_rows: list[tuple[str, str, str, str]] = []
+        # (updated_at, id) of the last listed thread while more pages remain
+        self._thread_cursor: tuple[str, int] | None = None
+        self._last_query: str | None = None
         self.current_view = "list"
         self.selected_thread_id = None
         self.list_view = None
         self.thread_view = None
+        self.thread_table = None
+        self.search_input = None
+        self.thread_header = None
+        self.posts_scroll = None
+        self.status_bar = None
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
@@ -458,14 +642,14 @@ class ForumViewer(App):
                 yield Button("➕ New Thread", id="new-thread-btn", variant="success")
 
             # Thread list table
-            table = DataTable(id="thread-table", cursor_type="row")
+            table = ThreadTable(id="thread-table", cursor_type="row")
             table.add_columns("🆔", "📌 Title", "✍️ Author", "💬 Last Updated")
             yield table
 
         # Thread Detail View
         with Container(id="thread-view"):
             yield Static("", id="thread-header", classes="thread-info")
-            yield VerticalScroll(id="posts-scroll")
+            yield PostScroll(id="posts-scroll")
 
             with Horizontal(classes="action-buttons"):
                 yield Button("⬅️ Back to List", id="back-btn")
@@ -478,41 +662,84 @@ class ForumViewer(App):
         """Load initial thread list."""
         self.list_view = self.query_one("#list-view", Container)
         self.thread_view = self.query_one("#thread-view", Container)
+        self.thread_table = self.query_one("#thread-table", ThreadTable)
+        self.search_input = self.query_one("#search-input", Input)
+        self.thread_header = self.query_one("#thread-header", Static)
+        self.posts_scroll = self.query_one("#posts-scroll", PostScroll)
+        self.status_bar = self.query_one("#status-bar", Static)
         self.thread_view.display = False
         self.load_threads()
 
-    def load_threads(self) -> None:
+    def on_unmount(self) -> None:
+        """Stop the database thread and close the database."""
+        # Wait for an in-flight call so close() doesn't pull the connection
+        # out from under it; queued calls are dropped
+        self._db_executor.shutdown(wait=True, cancel_futures=True)
+        self.db.close()
+
+    async def _db_call(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        """Run a database call on the database thread so the UI stays responsive."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._db_executor, partial(fn, *args, **kwargs))
+
+    @work(exclusive=True, group="db")
+    async def load_threads(self, status: str | None = None) -> None:
         """Load and display threads from database."""
+        self._last_query = ""
+        self._thread_cursor = None
         try:
-            self.threads = self.db.list_threads(limit=50)
+            self.threads = await self._db_call(
+                self.db.list_thread_headers, limit=THREAD_PAGE_SIZE
+            )
+            self._thread_cursor = self._next_thread_cursor(self.threads)
             self.update_thread_table()
-            self.update_status(f"✨ Loaded {len(self.threads)} threads")
+            self.update_status(status or f"✨ Loaded {len(self.threads)} threads")
         except Exception as e:
             self.update_status(f"❌ Error loading threads: {e}")
 
     def update_thread_table(self) -> None:
-        """Update the thread list table with current threads."""
-        table = self.query_one("#thread-table", DataTable)
-        table.clear()
-
-        for thread in self.threads:
-            thread_id = thread.get("id", "?")
-            title = thread.get("title", "Untitled")[:50]
-            author = thread.get("author", "Unknown")[:20]
-            updated_at = thread.get("updated_at", "")
-
-            try:
-                dt = datetime.fromisoformat(updated_at)
-                time_str = dt.strftime("%m/%d %H:%M")
-            except (ValueError, TypeError):
-                time_str = "?"
-
-            table.add_row(str(thread_id), title, author, time_str, key=str(thread_id))
+        """Update the thread list table with current threads.
+
+        If the displayed threads are still listed first and in the same order,
+        only the cells that changed are updated and any further threads are
+        appended; otherwise the table is rebuilt.
+        """
+        table = self.thread_table
+
+        # Bound once; these run for every row
+        rows = []
+        append_row = rows.append
+        fmt_ts = _fmt_ts
+        for thread_id, title, author, updated_at in map(_THREAD_ROW_FIELDS, self.threads):
+            time_str = fmt_ts(updated_at, "%m/%d %H:%M", "?")
+            append_row((str(thread_id), title[:50], author[:20], time_str))
+
+        shown = len(self._displayed_rows)
+        # One screen update for all cell and row changes below
+        with self.batch_update():
+            if [row[0] for row in rows[:shown]] == [
+                row[0] for row in self._displayed_rows
+            ]:
+                for row_index, (new, old) in enumerate(zip(rows, self._displayed_rows)):
+                    if new != old:
+                        for column, (value, old_value) in enumerate(zip(new, old)):
+                            if value != old_value:
+                                table.update_cell_at(
+                                    Coordinate(row_index, column), value
+                                )
+                new_rows = rows[shown:]
+            else:
+                table.clear()
+                new_rows = rows
+            # add_rows() can't set row keys, which row selection relies on
+            add_row = table.add_row
+            for row in new_rows:
+                add_row(*row, key=row[0])
+        self._displayed_rows = rows
 
     def update_status(self, message: str) -> None:
         """Update the status bar."""
-        status = self.query_one("#status-bar", Static)
-        status.update(message)
+        self.status_bar.update(message)
 
     async def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle thread selection."""
@@ -523,7 +750,7 @@ class ForumViewer(App):
     async def view_thread(self, thread_id: int) -> None:
         """Display a specific thread with all its posts."""
         try:
-            self.current_thread = self.db.read_thread(thread_id)
+            self.current_thread = await self._db_call(self.db.read_thread, thread_id)
             if not self.current_thread:
                 self.update_status("❌ Thread not found!")
                 return
@@ -531,58 +758,24 @@ class ForumViewer(App):
             thread_info = self.current_thread["thread"]
             posts = self.current_thread["posts"]
 
-            # Update thread header
-            header = self.query_one("#thread-header", Static)
-            reply_count = len(posts)
-            if reply_count == 0:
-                post_info = "💬 1 post (no replies yet)"
-            elif reply_count == 1:
-                post_info = "💬 1 post + 1 reply"
-            else:
-                post_info = f"💬 1 post + {reply_count} replies"
-
-            header_text = (
-                f"📌 {thread_info['title']}\n"
-                f"by ✍️ {thread_info['author']} | "
-                f"Created: {thread_info['created_at'][:10]}\n"
-                f"{post_info}"
-            )
-            header.update(header_text)
-
-            # Get the posts scroll container and clear existing posts
-            posts_scroll = self.query_one("#posts-scroll", VerticalScroll)
-            await posts_scroll.remove_children()
-
-            # Format timestamp helper
-            def format_time(timestamp: str) -> str:
-                try:
-                    dt = datetime.fromisoformat(timestamp)
-                    return dt.strftime("%Y-%m-%d %H:%M:%S")
-                except (ValueError, TypeError):
-                    return timestamp
-
-            # Mount the original post
-            original_post = PostCard(
-                author=thread_info["author"],
-                body=thread_info["body"],
-                timestamp=format_time(thread_info["created_at"]),
-                is_original=True,
-            )
-            await posts_scroll.mount(original_post)
-
-            # Mount all replies
-            for i, post in enumerate(posts):
-                quoted_text = post.get("quoted_post_body")
-                reply_card = PostCard(
-                    author=post.get("author", "Unknown"),
-                    body=post.get("body", ""),
-                    timestamp=format_time(post.get("created_at", "")),
-                    is_original=False,
-                    post_number=i + 1,
-                    post_id=post.get("id"),
-                    quoted_text=quoted_text,
-                )
-                await posts_scroll.mount(reply_card)
+            # Posts are only ever added or deleted, so the count and the last
+            # post ID tell whether the displayed cards are still current
+            signature = (thread_id, len(posts), posts[-1]["id"] if posts else None)
+            if signature != self._shown_thread_sig:
+                # Only the first page of cards is mounted; the rest follow on
+                # scroll. Refreshing the same thread keeps the mounted cards and
+                # only adds the new replies.
+                posts_scroll = self.posts_scroll
+                shown = self.current_posts if thread_id == self.selected_thread_id else []
+                self.current_posts = posts
+                self.update_thread_header()
+                if shown and [p["id"] for p in posts[: len(shown)]] == [p["id"] for p in shown]:
+                    await posts_scroll.extend(self.make_post_card, len(posts) + 1)
+                else:
+                    if thread_id != self.selected_thread_id:
+                        _render_post.cache_clear()
+                    await posts_scroll.show(self.make_post_card, len(posts) + 1)
+                self._shown_thread_sig = signature
 
             # Switch to thread view
             self.list_view.display = False
@@ -595,6 +788,51 @@ class ForumViewer(App):
         except Exception as e:
             self.update_status(f"❌ Error loading thread: {e}")
 
+    def update_thread_header(self) -> None:
+        """Update the thread header with the current thread and reply count."""
+        thread_info = self.current_thread["thread"]
+        prefix = self._header_prefix_cache.get(thread_info["id"])
+        if prefix is None:
+            # Title, author and creation date never change; only the count does
+            prefix = (
+                f"📌 {thread_info['title']}\n"
+                f"by ✍️ {thread_info['author']} | "
+                f"Created: {thread_info['created_at'][:10]}\n"
+            )
+            self._header_prefix_cache[thread_info["id"]] = prefix
+
+        reply_count = len(self.current_posts)
+        if reply_count == 0:
+            post_info = "💬 1 post (no replies yet)"
+        elif reply_count == 1:
+            post_info = "💬 1 post + 1 reply"
+        else:
+            post_info = f"💬 1 post + {reply_count} replies"
+
+        self.thread_header.update(prefix + post_info)
+
+    def make_post_card(self, index: int) -> PostCard:
+        """Build the card for the current thread; 0 is the original post, i is reply #i."""
+        if index == 0:
+            thread_info = self.current_thread["thread"]
+            return PostCard(
+                author=thread_info["author"],
+                body=thread_info["body"],
+                timestamp=_fmt_ts(thread_info["created_at"], "%Y-%m-%d %H:%M:%S"),
+                is_original=True,
+            )
+        post = self.current_posts[index - 1]
+        post_id, author, body, created_at = _POST_CARD_FIELDS(post)
+        return PostCard(
+            author=author,
+            body=body,
+            timestamp=_fmt_ts(created_at, "%Y-%m-%d %H:%M:%S"),
+            is_original=False,
+            post_number=index,
+            post_id=post_id,
+            quoted_text=post.get("quoted_post_body"),
+        )
+
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         button_id = event.button.id
@@ -617,18 +855,78 @@ class ForumViewer(App):
         if event.input.id == "search-input":
             self.action_search()
 
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Search as the user types, once they pause for SEARCH_DEBOUNCE seconds."""
+        if event.input.id == "search-input":
+            if self._search_timer is not None:
+                self._search_timer.stop()
+            self._search_timer = self.set_timer(self.SEARCH_DEBOUNCE, self._run_search)
+
     def action_search(self) -> None:
         """Search threads based on input."""
+        if self._search_timer is not None:
+            self._search_timer.stop()
+            self._search_timer = None
+        self._run_search()
+
+    @staticmethod
+    def _next_thread_cursor(page: list[dict]) -> tuple[str, int] | None:
+        """Get the keyset cursor after a page of threads, or None if it was the last."""
+        if len(page) < THREAD_PAGE_SIZE:
+            return None
+        return page[-1]["updated_at"], page[-1]["id"]
+
+    def on_thread_table_near_end(self, event: ThreadTable.NearEnd) -> None:
+        """Fetch the next page of threads when the table is scrolled to the end."""
+        if self._thread_cursor is not None:
+            self.load_more_threads()
+
+    @work(exclusive=True, group="db")
+    async def load_more_threads(self) -> None:
+        """Append the next page of threads to the list."""
+        cursor = self._thread_cursor
+        if cursor is None:
+            return
+        self._thread_cursor = None
         try:
-            search_input = self.query_one("#search-input", Input)
-            query = search_input.value.strip()
+            page = await self._db_call(
+                self.db.list_thread_headers,
+                limit=THREAD_PAGE_SIZE,
+                before_updated_at=cursor[0],
+                before_id=cursor[1],
+            )
+        except Exception as e:
+            self._thread_cursor = cursor
+            self.update_status(f"❌ Error loading threads: {e}")
+            return
+        self._thread_cursor = self._next_thread_cursor(page)
+        # list_thread_headers and search_threads build fresh lists (neither
+        # is cached), so the loaded list can be extended in place
+        self.threads.extend(page)
+        self.update_thread_table()
+        self.update_status(f"✨ Loaded {len(self.threads)} threads")
+
+    def _run_search(self) -> None:
+        """Run the search for the current input, unless it is already shown."""
+        self._search_timer = None
+        query = self.search_input.value.strip()
+        if query == self._last_query:
+            return
+        self._last_query = query
 
-            if not query:
-                self.load_threads()
-                self.update_status("✨ Showing all threads")
-                return
+        if not query:
+            self.load_threads("✨ Showing all threads")
+        else:
+            self._search_threads(query)
 
-            self.threads = self.db.search_threads(query=query, search_in="all", limit=50)
+    @work(exclusive=True, group="db")
+    async def _search_threads(self, query: str) -> None:
+        """Search threads and display the results."""
+        self._thread_cursor = None
+        try:
+            self.threads = await self._db_call(
+                self.db.search_threads, query=query, search_in="all", limit=50
+            )
             self.update_thread_table()
 
             if self.threads:
@@ -643,50 +941,25 @@ class ForumViewer(App):
     def action_show_list(self) -> None:
         """Show the thread list view."""
         # Clear search and reload all threads
-        search_input = self.query_one("#search-input", Input)
-        search_input.value = ""
+        self.search_input.value = ""
 
         self.list_view.display = True
         self.thread_view.display = False
 
         self.current_view = "list"
-        self.load_threads()
-        self.update_status("✨ Showing all threads")
+        self.load_threads("✨ Showing all threads")
 
     async def action_refresh(self) -> None:
         """Refresh current view."""
         if self.current_view == "list":
-            self.load_threads()
-            self.update_status("✨ Refreshed thread list")
+            self.load_threads("✨ Refreshed thread list")
         elif self.current_view == "thread" and self.selected_thread_id:
             await self.view_thread(self.selected_thread_id)
             self.update_status("✨ Refreshed thread view")
 
     def action_help(self) -> None:
         """Show help message."""
-        help_text = (
-            "🆘 FORUM EXPLORER HELP\n\n"
-            "Controls:\n"
-            "  • Click threads to view details\n"
-            "  • Search using the search bar\n"
-            "  • 'All Threads' shows recent threads\n"
-            "  • Press ⬅️ Back to return to list\n\n"
-            "Keyboard:\n"
-            "  L - List threads\n"
-            "  R - Refresh current view\n"
-            "  N - Create new thread\n"
-            "  P - Reply to current thread\n"
-            "  Q - Quit application\n"
-            "  ? - Show this help\n\n"
-            "Features:\n"
-            "  ✨ View all forum threads\n"
-            "  🔍 Search by title/author/content\n"
-            "  📌 Read full thread discussions\n"
-            "  💬 See post quotes and replies\n"
-            "  📝 Create new threads\n"
-            "  💬 Reply to discussions"
-        )
-        self.update_status(help_text)
+        self.update_status(_HELP_TEXT)
 
     def action_new_thread(self) -> None:
         """Open the new thread modal."""
@@ -703,21 +976,10 @@ class ForumViewer(App):
                 )
                 self.update_status(f"✅ Thread created! ID: {thread_id}")
                 self.load_threads()
-                # View the new thread - schedule it as a callback
-                self.call_later(self._go_to_thread, thread_id)
+                self.run_worker(self.view_thread(thread_id), exclusive=True)
             except Exception as e:
                 self.update_status(f"❌ Error creating thread: {e}")
 
-    def _go_to_thread(self, thread_id: int) -> None:
-        """Navigate to a thread (scheduled callback)."""
-        # Use set_timer to allow the UI to settle before navigating
-        self.set_timer(0.1, lambda: self._do_view_thread(thread_id))
-
-    def _do_view_thread(self, thread_id: int) -> None:
-        """Actually view the thread."""
-        import asyncio
-        asyncio.create_task(self.view_thread(thread_id))
-
     def action_reply(self) -> None:
         """Open the reply modal for the current thread."""
         if self.current_view != "thread" or not self.current_thread:
@@ -733,18 +995,27 @@ class ForumViewer(App):
     def _on_reply_result(self, result: dict | None) -> None:
         """Handle result from reply modal."""
         if result:
-            try:
-                post_id = self.db.create_post(
-                    thread_id=result["thread_id"],
-                    body=result["body"],
-                    author=result["author"],
-                )
-                self.update_status(f"✅ Reply posted! Post ID: {post_id}")
-                # Refresh the thread view - we're already viewing the thread,
-                # just need to reload it to show the new reply
-                self._do_view_thread(result["thread_id"])
-            except Exception as e:
-                self.update_status(f"❌ Error posting reply: {e}")
+            self._post_reply(result)
+
+    @work(group="reply")
+    async def _post_reply(self, result: dict) -> None:
+        """Create the reply on the database thread and show the thread's new tail."""
+        try:
+            post_id = await self._db_call(
+                self.db.create_post,
+                thread_id=result["thread_id"],
+                body=result["body"],
+                author=result["author"],
+            )
+        except Exception as e:
+            self.update_status(f"❌ Error posting reply: {e}")
+            return
+        # Re-read the thread rather than appending only this post, so replies
+        # other clients made in the meantime show up too; view_thread keeps
+        # the mounted cards and only adds the new ones
+        await self.view_thread(result["thread_id"])
+        self.posts_scroll.scroll_end()
+        self.update_status(f"✅ Reply posted! Post ID: {post_id}")
 
 
 def main():
@@ -1,36 +1,108 @@
 
 import os
+import asyncio
 import json
-import requests
+import hashlib
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from types import SimpleNamespace
+import httpx
 from typing import Annotated
 from fastmcp import FastMCP
 from fastmcp.server.dependencies import get_http_headers
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
-
 SERVER_INSTRUCTIONS = """
 You are an expert GitHub assistant for repo exploration and issue tracking.
 Use the available tools to query GitHub's GraphQL API for api, project data, issues or anything else you are curious about.
 """
 
+# Configuration
+@lru_cache(maxsize=1)
+def _config():
+    """Settings from the environment (and .env), read once on first use.
+
+    Call _config.cache_clear() to pick up changed settings.
+    """
+    load_dotenv()
+    return SimpleNamespace(
+        token=os.getenv("GITHUB_TOKEN"),
+        owner=os.getenv("GITHUB_OWNER", "strf0x1"),
+        # Seconds to reuse a query result for; 0 disables the result cache
+        cache_ttl=float(os.getenv("GITHUB_MCP_CACHE_TTL", "60")),
+    )
+
+GITHUB_API_URL = "https://api.github.com/graphql"
+
+# Shared async client: keeps HTTPS connections to GitHub alive across queries
+# and lets concurrent tool calls wait on GitHub without blocking each other
+_CLIENT = httpx.AsyncClient(
+    headers={
+        "Accept": "application/json",
+        "User-Agent": "github-mcp-server",
+    },
+    # Every request goes to api.github.com, so the whole pool is for one host.
+    # Idle connections are kept for a minute (httpx default: 5s) so bursts of
+    # tool calls a few seconds apart reuse the TLS connection instead of
+    # resolving and handshaking again.
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=64, keepalive_expiry=60),
+    timeout=30,
+    # api.github.com negotiates HTTP/2 via ALPN, so concurrent queries share
+    # one connection as separate streams; the pool limits above only matter
+    # if a proxy forces HTTP/1.1
+    http2=True,
+)
+
+@asynccontextmanager
+async def lifespan(server):
+    """Close the HTTP client's connections when the server shuts down."""
+    try:
+        yield {}
+    finally:
+        await _CLIENT.aclose()
+
 # Initialize FastMCP server
 mcp = FastMCP(
     name="GitHub GraphQL Explorer",
-    instructions=SERVER_INSTRUCTIONS
+    instructions=SERVER_INSTRUCTIONS,
+    lifespan=lifespan,
 )
 
-# Configuration
-GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
-GITHUB_OWNER = os.getenv("GITHUB_OWNER", "strf0x1")
-GITHUB_API_URL = "https://api.github.com/graphql"
+# Short-lived cache of query results, so retried or repeated queries skip
+# the round trip and don't count against the GraphQL rate limit.
+# Set GITHUB_MCP_CACHE_TTL=0 to disable.
+CACHE_SIZE = 512
+_cache: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+# Retry policy for transient server errors and GitHub's secondary rate limits
+MAX_RETRIES = 4
+RETRY_BACKOFF = 0.5  # seconds, doubled on each attempt
+MAX_RETRY_WAIT = 60  # fail instead of waiting longer than this
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# When fewer requests than this remain, hold the token's next request until
+# its rate limit window resets
+RATE_LIMIT_LOW_WATER = 10
+# Rate limit reset time per token hash; expired entries are pruned as
+# others are added, so the dict only holds tokens currently being held
+_rate_limit_resets: dict[bytes, float] = {}
+
+# Token resolved for the current request. Each MCP request runs in its own
+# task context, so this never leaks between callers.
+_request_token: ContextVar[str | None] = ContextVar("github_token", default=None)
 
 def get_github_token() -> str:
     """Get GitHub token from HTTP header or fall back to environment variable.
     
     Checks for X-GitHub-Token header in HTTP requests. If not present or
     not in HTTP context, falls back to GITHUB_TOKEN environment variable.
+    The result is remembered for the rest of the request.
     
     Returns:
         GitHub personal access token
@@ -38,123 +110,428 @@ def get_github_token() -> str:
     Raises:
         ValueError: If token is not found in header or environment
     """
+    token = _request_token.get()
+    if token:
+        return token
+
     headers = get_http_headers()
-    # Check for custom token header (case-insensitive)
-    token_from_header = headers.get("x-github-token")
-    if token_from_header:
-        return token_from_header
-    
-    # Fall back to environment variable
-    if not GITHUB_TOKEN:
+    # Check for custom token header (case-insensitive), falling back to
+    # the environment variable
+    token = headers.get("x-github-token") or _config().token
+    if not token:
         raise ValueError("GITHUB_TOKEN environment variable or X-GitHub-Token header not set")
     
-    return GITHUB_TOKEN
+    _request_token.set(token)
+    return token
 
-def run_query(query, variables=None):
-    """Execute a GraphQL query against the GitHub API."""
-    token = get_github_token()
-        
-    headers = {"Authorization": f"Bearer {token}"}
-    response = requests.post(GITHUB_API_URL, json={'query': query, 'variables': variables}, headers=headers)
-    
-    if response.status_code == 200:
-        return response.json()
+
+_OPENING = frozenset("{([")
+_CLOSING = {"}": "{", ")": "(", "]": "["}
+
+def _position(query, i):
+    line = query.count("\n", 0, i) + 1
+    column = i - query.rfind("\n", 0, i)
+    return f"line {line}, column {column}"
+
+@lru_cache(maxsize=256)
+def _query_syntax_error(query):
+    """Cheap local check for malformed queries, or None if it looks fine.
+
+    Only catches empty queries and unbalanced brackets or strings (what a
+    truncated query looks like); GitHub still does the full validation.
+    Cached so a resent query isn't scanned again.
+    """
+    if not query.strip():
+        return "query is empty"
+    stack = []
+    i, n = 0, len(query)
+    while i < n:
+        c = query[i]
+        if c == "#":
+            i = query.find("\n", i)
+            if i < 0:
+                break
+        elif query.startswith('"""', i):
+            end = query.find('"""', i + 3)
+            while end > 0 and query[end - 1] == "\\":
+                end = query.find('"""', end + 3)
+            if end < 0:
+                return f"unterminated block string at {_position(query, i)}"
+            i = end + 2
+        elif c == '"':
+            j = i + 1
+            while j < n and query[j] not in '"\n':
+                j += 2 if query[j] == "\\" else 1
+            if j >= n or query[j] != '"':
+                return f"unterminated string at {_position(query, i)}"
+            i = j
+        elif c in _OPENING:
+            stack.append(i)
+        elif c in _CLOSING:
+            if not stack or query[stack[-1]] != _CLOSING[c]:
+                return f"unexpected '{c}' at {_position(query, i)}"
+            stack.pop()
+        i += 1
+    if stack:
+        return f"unclosed '{query[stack[-1]]}' at {_position(query, stack[-1])}"
+    return None
+
+def _header_float(headers, name):
+    try:
+        return float(headers[name])
+    except (KeyError, ValueError):
+        return None
+
+def _retry_delay(response, attempt, retry_server_errors):
+    """Seconds to wait before retrying a failed request, or None to give up.
+
+    Honours Retry-After and the x-ratelimit-* headers GitHub sends with
+    (secondary) rate limit responses, and backs off exponentially on
+    transient server errors.
+    """
+    headers = response.headers
+    retry_after = _header_float(headers, "retry-after")
+    reset = _header_float(headers, "x-ratelimit-reset")
+    if retry_after is not None:
+        delay = retry_after
+    elif headers.get("x-ratelimit-remaining") == "0" and reset is not None:
+        delay = reset - time.time()
+    elif response.status_code == 429 or (retry_server_errors and response.status_code in RETRY_STATUSES):
+        delay = RETRY_BACKOFF * 2 ** attempt
+    else:
+        return None
+    return max(delay, 0.0) if delay <= MAX_RETRY_WAIT else None
+
+@lru_cache(maxsize=8)
+def _token_key(token):
+    """Hash of a token, so module state never holds the token itself."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+def _note_rate_limit(response, token):
+    """Hold further requests for this token if its rate limit is nearly spent."""
+    remaining = _header_float(response.headers, "x-ratelimit-remaining")
+    reset = _header_float(response.headers, "x-ratelimit-reset")
+    if remaining is None or reset is None:
+        return
+    key = _token_key(token)
+    now = time.time()
+    if remaining < RATE_LIMIT_LOW_WATER and reset - now <= MAX_RETRY_WAIT:
+        for expired in [k for k, t in _rate_limit_resets.items() if t <= now]:
+            del _rate_limit_resets[expired]
+        _rate_limit_resets[key] = reset
     else:
-        raise Exception(f"Query failed with code {response.status_code}: {query}")
+        _rate_limit_resets.pop(key, None)
+
+@lru_cache(maxsize=8)
+def _auth_headers(token):
+    """Per-request headers for a token; built once per token, never mutated."""
+    return {"Authorization": f"Bearer {token}"}
+
+async def run_query(query, variables=None, token=None):
+    """Execute a GraphQL query against the GitHub API.
+
+    Rate-limited requests, and transient server errors on non-mutations,
+    are retried up to MAX_RETRIES times.
+    """
+    if token is None:
+        token = get_github_token()
+
+    headers = _auth_headers(token)
+    payload = {'query': query, 'variables': variables}
+    retry_server_errors = not _is_mutation(query)
+    for attempt in range(MAX_RETRIES + 1):
+        wait = _rate_limit_resets.get(_token_key(token), 0.0) - time.time()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        response = await _CLIENT.post(GITHUB_API_URL, json=payload, headers=headers)
+        _note_rate_limit(response, token)
+        if response.status_code == 200:
+            return response.json()
+
+        delay = _retry_delay(response, attempt, retry_server_errors)
+        if delay is None or attempt == MAX_RETRIES:
+            break
+        await asyncio.sleep(delay)
+
+    message = f"Query failed with code {response.status_code}: {query}"
+    if "x-ratelimit-remaining" in response.headers:
+        message += f" (rate limit remaining: {response.headers['x-ratelimit-remaining']}, resets at: {response.headers.get('x-ratelimit-reset')})"
+    raise Exception(message)
+
+def _cache_key(query, variables, token):
+    """Hash the inputs, so the cache holds neither query text nor tokens."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in (query, json.dumps(variables, sort_keys=True), token):
+        h.update(part.encode())
+        h.update(b"\0")
+    return h.digest()
+
+async def cached_run_query(query, variables=None):
+    """Execute a GraphQL query, reusing a recent identical result if there is one.
+
+    Only successful results of non-mutation queries are cached, per token,
+    for GITHUB_MCP_CACHE_TTL seconds.
+    """
+    token = get_github_token()
+    ttl = _config().cache_ttl
+    if ttl <= 0 or _is_mutation(query):
+        return await run_query(query, variables, token)
+
+    key = _cache_key(query, variables, token)
+    now = time.monotonic()
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None and entry[0] > now:
+            _cache.move_to_end(key)
+            return entry[1]
+
+    result = await run_query(query, variables, token)
+    if "errors" not in result:
+        with _cache_lock:
+            _cache[key] = (now + ttl, result)
+            _cache.move_to_end(key)
+            if len(_cache) > CACHE_SIZE:
+                _cache.popitem(last=False)
+    return result
+
+def _tool_result(result):
+    """What a tool returns for a query result: the data, or data and errors."""
+    if "errors" in result:
+        return {"errors": result["errors"], "data": result.get("data")}
+    return result.get("data", {})
+
+def _error_result(e):
+    return {"error": str(e), "error_type": type(e).__name__}
+
+# Largest variables JSON accepted; anything bigger is refused before parsing
+MAX_VARIABLES_SIZE = 256 * 1024
+
+# Batching: plain queries are merged into one request by aliasing each
+# top-level field as q<n>_<key>, so N queries cost one round trip and one
+# rate limit point instead of N.
+BATCH_SIZE = 10
+
+_TOKEN_RE = re.compile(r'''
+    [\s,]+ | \#[^\n]*
+    | (?P<tok>"""(?:\\"""|(?!""")[\s\S])*""" | "(?:\\.|[^"\\\n])*" | \.\.\. | \w+ | \S)
+''', re.VERBOSE)
+_NAME_RE = re.compile(r"[_A-Za-z]\w*")
+
+@lru_cache(maxsize=256)
+def _is_mutation(query):
+    """Whether the document defines a mutation operation.
+
+    Checks the keyword that starts each top-level definition, so comments
+    and whitespace before it, or a mutation after a query, are seen.
+    Mutation results are never cached and their server errors never retried.
+    """
+    definition_start = True
+    for tok, _, _ in _top_level_items(query):
+        if definition_start and tok == "mutation":
+            return True
+        # A new definition begins after each top-level selection set
+        definition_start = tok == "{"
+    return False
+
+def _top_level_items(query):
+    """Split a query into (text, start, end) items, with each bracket group
+    collapsed into a single item. Assumes the brackets are balanced."""
+    items = []
+    depth = 0
+    for m in _TOKEN_RE.finditer(query):
+        tok = m.group("tok")
+        if tok is None:
+            continue
+        if tok in _OPENING:
+            if depth == 0:
+                group_start = m.start()
+            depth += 1
+        elif tok in _CLOSING:
+            depth -= 1
+            if depth == 0:
+                items.append((query[group_start], group_start, m.end()))
+        elif depth == 0:
+            items.append((tok, m.start(), m.end()))
+    return items
+
+def _batch_fields(query):
+    """Split a plain query into its top-level fields for merging.
+
+    Returns a list of (response key, field source without alias), or None
+    if the query can't be merged: mutations, variables, fragments,
+    operation directives or several operations.
+    """
+    items = _top_level_items(query)
+    i = 0
+    if items and items[0][0] == "query":
+        i = 1
+        if i < len(items) and _NAME_RE.fullmatch(items[i][0]):
+            i += 1
+    if i != len(items) - 1 or items[i][0] != "{":
+        return None
+    body_start, body_end = items[i][1] + 1, items[i][2] - 1
+    body = _top_level_items(query[body_start:body_end])
+
+    fields = []
+    j = 0
+    while j < len(body):
+        key, start, end = body[j]
+        if not _NAME_RE.fullmatch(key):
+            return None
+        j += 1
+        if j < len(body) and body[j][0] == ":":
+            if j + 1 >= len(body) or not _NAME_RE.fullmatch(body[j + 1][0]):
+                return None
+            start, end = body[j + 1][1], body[j + 1][2]
+            j += 2
+        if j < len(body) and body[j][0] == "(":
+            end = body[j][2]
+            j += 1
+        while j + 1 < len(body) and body[j][0] == "@" and _NAME_RE.fullmatch(body[j + 1][0]):
+            end = body[j + 1][2]
+            j += 2
+            if j < len(body) and body[j][0] == "(":
+                end = body[j][2]
+                j += 1
+        if j < len(body) and body[j][0] == "{":
+            end = body[j][2]
+            j += 1
+        fields.append((key, query[body_start + start:body_start + end]))
+    return fields or None
+
+async def _run_merged(chunk):
+    """Run [(n, fields)] as one merged query and split the result per query.
+
+    Returns {n: result} in the usual GraphQL result shape, or None if the
+    request failed as a whole (or returned errors that can't be attributed
+    to one query).
+    """
+    owners = {}
+    lines = []
+    for n, fields in chunk:
+        for key, source in fields:
+            alias = f"q{n}_{key}"
+            owners[alias] = (n, key)
+            lines.append(f"  {alias}: {source}")
+    try:
+        result = await cached_run_query("query {\n" + "\n".join(lines) + "\n}")
+    except Exception:  # noqa: BLE001 - whatever failed, the caller reruns the queries separately and reports their own errors
+        return None
+
+    data = result.get("data") or {}
+    split = {n: {"data": {}} for n, _ in chunk}
+    for alias, (n, key) in owners.items():
+        split[n]["data"][key] = data.get(alias)
+    for error in result.get("errors", []):
+        path = error.get("path")
+        if not path or path[0] not in owners:
+            return None
+        n, key = owners[path[0]]
+        # locations refer to the merged query, so they would mislead
+        error = {k: v for k, v in error.items() if k != "locations"}
+        error["path"] = [key, *path[1:]]
+        split[n].setdefault("errors", []).append(error)
+    return split
+
+def _add_health_route():
+    """Register the /health endpoint for Docker/container orchestration.
 
-# Health check endpoint for Docker/container orchestration
-try:
-    # Import will only work in HTTP context, safe to fail silently
+    Only called for the HTTP transport; stdio has no routes to serve.
+    """
     from starlette.responses import PlainTextResponse
-    
+
     @mcp.custom_route("/health", methods=["GET"])
     async def health_check(request) -> PlainTextResponse:
         """Health check endpoint for container orchestration systems."""
         return PlainTextResponse("OK", status_code=200)
-except ImportError:
-    pass  # Starlette not available in some contexts, health check won't be registered
 
-@mcp.tool(description="Execute a custom GraphQL query against the GitHub API to query repositories, projects, issues, pull requests, and more.")
-def github_graphql_query(
-    query: Annotated[str, "The GraphQL query string to execute against the GitHub API"],
-    variables: Annotated[str | None, "Optional JSON string of variables for the query (e.g., '{\"owner\": \"myorg\", \"repo\": \"myrepo\"}')"] = None
-) -> str:
-    """
-    Execute a custom GraphQL query against the GitHub API.
-    
-    This tool provides direct access to GitHub's GraphQL API, allowing you to query any data
-    available through the API. You can query repositories, projects, issues, pull requests,
-    users, organizations, and more.
-    
-    The default repository owner and repo from environment variables are:
-    - GITHUB_OWNER: {owner}
-    
-    Example queries:
-    
-    1. Get repository information:
-       query {{
-         repository(owner: "{owner}", name: "mcp-experiment-001") {{
-           name
-           description
-           stargazerCount
-         }}
-       }}
-    
-    2. Get open projects with items:
-       query {{
-         repository(owner: "{owner}", name: "mcp-experiment-001") {{
-           projectsV2(first: 10, query: "is:open") {{
+def _use_uvloop():
+    """Run the HTTP server on uvloop if it is installed (not on Windows)."""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+# Long-form tool docs; _fill_tool_doc() fills in the configured owner once
+# when the server starts, so importing this module reads no configuration
+_TOOL_DOC_TEMPLATE = """
+Execute a custom GraphQL query against the GitHub API.
+
+This tool provides direct access to GitHub's GraphQL API, allowing you to query any data
+available through the API. You can query repositories, projects, issues, pull requests,
+users, organizations, and more.
+
+The default repository owner and repo from environment variables are:
+- GITHUB_OWNER: {owner}
+
+Example queries:
+
+1. Get repository information:
+   query {{
+     repository(owner: "{owner}", name: "mcp-experiment-001") {{
+       name
+       description
+       stargazerCount
+     }}
+   }}
+
+2. Get open projects with items:
+   query {{
+     repository(owner: "{owner}", name: "mcp-experiment-001") {{
+       projectsV2(first: 10, query: "is:open") {{
+         nodes {{
+           id
+           title
+           items(first: 20) {{
              nodes {{
-               id
-               title
-               items(first: 20) {{
-                 nodes {{
-                   content {{
-                     ... on Issue {{
-                       number
-                       title
-                       state
-                     }}
-                   }}
+               content {{
+                 ... on Issue {{
+                   number
+                   title
+                   state
                  }}
                }}
              }}
            }}
          }}
        }}
-    
-    3. Get issues with custom fields:
-       query {{
-         repository(owner: "{owner}", name: "mcp-experiment-001") {{
-           projectsV2(first: 1) {{
+     }}
+   }}
+
+3. Get issues with custom fields:
+   query {{
+     repository(owner: "{owner}", name: "mcp-experiment-001") {{
+       projectsV2(first: 1) {{
+         nodes {{
+           items(first: 50) {{
              nodes {{
-               items(first: 50) {{
+               content {{
+                 ... on Issue {{
+                   number
+                   title
+                   body
+                   assignees(first: 5) {{
+                     nodes {{ login }}
+                   }}
+                 }}
+               }}
+               fieldValues(first: 20) {{
                  nodes {{
-                   content {{
-                     ... on Issue {{
-                       number
-                       title
-                       body
-                       assignees(first: 5) {{
-                         nodes {{ login }}
-                       }}
-                     }}
+                   ... on ProjectV2ItemFieldTextValue {{
+                     text
+                     field {{ ... on ProjectV2FieldCommon {{ name }} }}
                    }}
-                   fieldValues(first: 20) {{
-                     nodes {{
-                       ... on ProjectV2ItemFieldTextValue {{
-                         text
-                         field {{ ... on ProjectV2FieldCommon {{ name }} }}
-                       }}
-                       ... on ProjectV2ItemFieldSingleSelectValue {{
-                         name
-                         field {{ ... on ProjectV2FieldCommon {{ name }} }}
-                       }}
-                       ... on ProjectV2ItemFieldIterationValue {{
-                         title
-                         field {{ ... on ProjectV2FieldCommon {{ name }} }}
-                       }}
-                     }}
+                   ... on ProjectV2ItemFieldSingleSelectValue {{
+                     name
+                     field {{ ... on ProjectV2FieldCommon {{ name }} }}
+                   }}
+                   ... on ProjectV2ItemFieldIterationValue {{
+                     title
+                     field {{ ... on ProjectV2FieldCommon {{ name }} }}
                    }}
                  }}
                }}
@@ -162,17 +539,37 @@ def github_graphql_query(
            }}
          }}
        }}
-    
-    For more information on GitHub's GraphQL API:
-    https://docs.github.com/en/graphql
-    
-    Use the GraphQL Explorer to test queries:
-    https://docs.github.com/en/graphql/overview/explorer
-    """.format(owner=GITHUB_OWNER)
+     }}
+   }}
+
+For more information on GitHub's GraphQL API:
+https://docs.github.com/en/graphql
+
+Use the GraphQL Explorer to test queries:
+https://docs.github.com/en/graphql/overview/explorer
+"""
+
+@mcp.tool(description="Execute a custom GraphQL query against the GitHub API to query repositories, projects, issues, pull requests, and more.")
+async def github_graphql_query(
+    query: Annotated[str, "The GraphQL query string to execute against the GitHub API"],
+    variables: Annotated[str | None, "Optional JSON string of variables for the query (e.g., '{\"owner\": \"myorg\", \"repo\": \"myrepo\"}')"] = None,
+    pretty: Annotated[bool, "Indent the JSON result for human reading (default: compact)"] = False
+) -> str:
+    """Execute a custom GraphQL query against the GitHub API."""
     
     try:
+        syntax_error = _query_syntax_error(query)
+        if syntax_error:
+            return json.dumps({
+                "error": f"Invalid GraphQL query: {syntax_error}"
+            })
+
         # Parse variables if provided
         parsed_variables = None
+        if variables and len(variables) > MAX_VARIABLES_SIZE:
+            return json.dumps({
+                "error": f"variables parameter is too large ({len(variables)} characters, limit {MAX_VARIABLES_SIZE})"
+            })
         if variables:
             try:
                 parsed_variables = json.loads(variables)
@@ -181,27 +578,62 @@ def github_graphql_query(
                     "error": f"Invalid JSON in variables parameter: {str(e)}"
                 })
         
-        result = run_query(query, parsed_variables)
-        
-        # Check for GraphQL errors
-        if "errors" in result:
-            return json.dumps({
-                "errors": result["errors"],
-                "data": result.get("data")
-            }, indent=2)
-        
-        return json.dumps(result.get("data", {}), indent=2)
+        result = await cached_run_query(query, parsed_variables)
+        return json.dumps(_tool_result(result), indent=2 if pretty else None)
         
     except Exception as e:
-        return json.dumps({
-            "error": str(e),
-            "error_type": type(e).__name__
-        })
+        return json.dumps(_error_result(e))
+
+def _fill_tool_doc():
+    """Attach the long-form docs, with the configured owner, to the query tool."""
+    github_graphql_query.fn.__doc__ = _TOOL_DOC_TEMPLATE.format(owner=_config().owner)
+
+@mcp.tool(description="Execute several GraphQL queries against the GitHub API, merging them into as few requests as possible. Returns a JSON list with one result per query, in order.")
+async def github_graphql_batch(
+    queries: Annotated[list[str], "The GraphQL query strings to execute. Plain queries (no variables or fragments) are merged into shared requests."],
+    pretty: Annotated[bool, "Indent the JSON result for human reading (default: compact)"] = False
+) -> str:
+    """Execute several GraphQL queries against the GitHub API in as few requests as possible."""
+    results = [None] * len(queries)
+
+    async def run_one(n):
+        try:
+            results[n] = _tool_result(await cached_run_query(queries[n]))
+        except Exception as e:  # noqa: BLE001 - one failed query becomes its error entry, as in github_graphql_query, instead of failing the batch
+            results[n] = _error_result(e)
+
+    async def run_merged(chunk):
+        merged = await _run_merged(chunk)
+        if merged is None:
+            # Batch-level failure: run the queries separately
+            await asyncio.gather(*(run_one(n) for n, _ in chunk))
+            return
+        for n, result in merged.items():
+            results[n] = _tool_result(result)
+
+    mergeable = []
+    separate = []
+    for n, query in enumerate(queries):
+        syntax_error = _query_syntax_error(query)
+        if syntax_error:
+            results[n] = {"error": f"Invalid GraphQL query: {syntax_error}"}
+            continue
+        fields = _batch_fields(query)
+        if fields:
+            mergeable.append((n, fields))
+        else:
+            separate.append(n)
+
+    chunks = [mergeable[i:i + BATCH_SIZE] for i in range(0, len(mergeable), BATCH_SIZE)]
+    await asyncio.gather(
+        *(run_merged(chunk) for chunk in chunks),
+        *(run_one(n) for n in separate),
+    )
+    return json.dumps(results, indent=2 if pretty else None)
 
 def main():
     """Main entry point for the GitHub MCP server."""
     import argparse
-    import sys
 
     parser = argparse.ArgumentParser(
         description="GitHub MCP Server - Natural language access to GitHub Project data"
@@ -236,10 +668,13 @@ def main():
     )
 
     args = parser.parse_args()
+    _fill_tool_doc()
 
     if args.transport == "stdio":
         mcp.run(transport="stdio")
     elif args.transport == "http":
+        _add_health_route()
+        _use_uvloop()
         # Configure Uvicorn for long-lived streaming connections
         uvicorn_config = {
             "timeout_keep_alive": 300,  # Keep connection alive for 5 minutes
@@ -259,6 +694,7 @@ def main():
 
 def main_stdio():
     """Entry point for stdio transport mode."""
+    _fill_tool_doc()
     mcp.run(transport="stdio")
 
 def main_http():
@@ -292,6 +728,9 @@ def main_http():
     )
     
     args = parser.parse_args()
+    _fill_tool_doc()
+    _add_health_route()
+    _use_uvloop()
     
     # Configure Uvicorn for long-lived streaming connections
     uvicorn_config = {
@@ -0,0 +1,483 @@
+"""Tests for the GitHub GraphQL MCP server."""
+
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from unittest import mock
+
+import httpx
+import pytest
+
+from github_mcp_server import server
+
+VIEWER_RESULT = {"data": {"viewer": {"login": "octocat"}}}
+
+
+@pytest.fixture(autouse=True)
+def github_env(monkeypatch):
+    """Use a fixed token and start every test with an empty result cache."""
+    monkeypatch.setattr(server._config(), "token", "test-token")
+    monkeypatch.setattr(server._config(), "cache_ttl", 60.0)
+    monkeypatch.setattr(server, "RETRY_BACKOFF", 0)
+    server._cache.clear()
+    server._rate_limit_resets.clear()
+    yield
+    server._cache.clear()
+    server._rate_limit_resets.clear()
+
+
+@pytest.fixture
+def post(monkeypatch):
+    """Replace the HTTP client's POST; set return_value/side_effect per test."""
+    mocked = mock.AsyncMock(return_value=httpx.Response(200, json=VIEWER_RESULT))
+    monkeypatch.setattr(server._CLIENT, "post", mocked)
+    return mocked
+
+
+def _sent_query(call):
+    return call.kwargs["json"]["query"]
+
+
+def _run_batch(queries):
+    return json.loads(asyncio.run(server.github_graphql_batch.fn(queries)))
+
+
+class TestConfig:
+    """Tests for reading configuration lazily."""
+
+    def test_import_reads_no_config(self):
+        """Test that importing the module neither loads .env nor reads settings."""
+        code = "from github_mcp_server import server; print(server._config.cache_info().currsize)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "0"
+
+    def test_tool_doc_names_configured_owner(self, monkeypatch):
+        """Test that the long-form docs are filled in with GITHUB_OWNER at startup."""
+        monkeypatch.setattr(server._config(), "owner", "example-org")
+        monkeypatch.setattr(server.github_graphql_query.fn, "__doc__", server.github_graphql_query.fn.__doc__)
+
+        server._fill_tool_doc()
+
+        assert 'repository(owner: "example-org"' in server.github_graphql_query.fn.__doc__
+
+
+class TestToken:
+    """Tests for resolving the GitHub token per request."""
+
+    @staticmethod
+    def _sent_token(post, monkeypatch, headers):
+        monkeypatch.setattr(server, "get_http_headers", lambda: headers)
+        asyncio.run(server.run_query("query { viewer { login } }"))
+        return post.await_args.kwargs["headers"]["Authorization"]
+
+    def test_header_token_wins(self, post, monkeypatch):
+        """Test that an X-GitHub-Token header is used over the configured token."""
+        assert self._sent_token(post, monkeypatch, {"x-github-token": "header-token"}) == "Bearer header-token"
+
+    def test_falls_back_to_configured_token(self, post, monkeypatch):
+        """Test that the cached config's GITHUB_TOKEN is used without a header, in a fresh request context."""
+        self._sent_token(post, monkeypatch, {"x-github-token": "header-token"})
+
+        assert self._sent_token(post, monkeypatch, {}) == "Bearer test-token"
+
+    def test_token_is_remembered_for_the_request(self, monkeypatch):
+        """Test that the token resolved first is kept for the rest of the request."""
+
+        async def resolve_twice():
+            monkeypatch.setattr(server, "get_http_headers", lambda: {"x-github-token": "first"})
+            first = server.get_github_token()
+            monkeypatch.setattr(server, "get_http_headers", lambda: {"x-github-token": "second"})
+            return first, server.get_github_token()
+
+        assert asyncio.run(resolve_twice()) == ("first", "first")
+
+
+class TestIsMutation:
+    """Tests for telling mutations apart from queries."""
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            'mutation { addStar(input: {starrableId: "x"}) { clientMutationId } }',
+            "  \n\tmutation AddStar { addStar(input: {}) { clientMutationId } }",
+            "# Star the repo\nmutation { addStar(input: {}) { clientMutationId } }",
+            "# one\n  # two\n,mutation { addStar(input: {}) { clientMutationId } }",
+            "query Q { viewer { login } }\nmutation M { addStar(input: {}) { clientMutationId } }",
+            "fragment F on Repository { id }\nmutation { addStar(input: {}) { clientMutationId } }",
+        ],
+    )
+    def test_detects_mutation_operations(self, query):
+        """Test that a mutation is found after comments or other definitions."""
+        assert server._is_mutation(query)
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "query { viewer { login } }",
+            "{ viewer { login } }",
+            "# mutation { addStar }\nquery { viewer { login } }",
+            'query { search(query: "mutation", type: REPOSITORY, first: 1) { repositoryCount } }',
+            "query { mutation: viewer { login } }",
+            "fragment mutation on User { login }\nquery { viewer { ...mutation } }",
+        ],
+    )
+    def test_ignores_mutation_outside_operation_type(self, query):
+        """Test that the word in comments, strings, aliases or names doesn't count."""
+        assert not server._is_mutation(query)
+
+
+class TestMutationHandling:
+    """Tests that mutations are neither cached nor retried."""
+
+    QUERY = '# Star the repo\nmutation { addStar(input: {starrableId: "x"}) { clientMutationId } }'
+
+    def test_commented_mutation_is_not_cached(self, post):
+        """Test that a mutation behind a comment reaches GitHub every time."""
+        asyncio.run(server.cached_run_query(self.QUERY))
+        asyncio.run(server.cached_run_query(self.QUERY))
+
+        assert post.await_count == 2
+        assert not server._cache
+
+    def test_commented_mutation_is_not_retried(self, post):
+        """Test that a server error on a mutation behind a comment isn't retried."""
+        post.return_value = httpx.Response(502)
+
+        with pytest.raises(Exception, match="502"):
+            asyncio.run(server.cached_run_query(self.QUERY))
+
+        assert post.await_count == 1
+
+    def test_query_is_cached_and_retried(self, post):
+        """Test that a plain query is retried on a server error and then cached."""
+        post.side_effect = [httpx.Response(502), httpx.Response(200, json=VIEWER_RESULT)]
+        query = "# Who am I\nquery { viewer { login } }"
+
+        assert asyncio.run(server.cached_run_query(query)) == VIEWER_RESULT
+        assert asyncio.run(server.cached_run_query(query)) == VIEWER_RESULT
+
+        assert post.await_count == 2
+
+
+class TestRateLimit:
+    """Tests for holding requests while a token's rate limit is nearly spent."""
+
+    @staticmethod
+    def _response(remaining, reset):
+        return httpx.Response(
+            200,
+            json=VIEWER_RESULT,
+            headers={
+                "x-ratelimit-remaining": str(remaining),
+                "x-ratelimit-reset": str(reset),
+            },
+        )
+
+    def test_resets_are_keyed_by_token_hash(self):
+        """Test that the held tokens aren't kept in memory as plain text."""
+        reset = time.time() + 30
+        server._note_rate_limit(self._response(1, reset), "secret-token")
+
+        assert "secret-token" not in server._rate_limit_resets
+        assert server._rate_limit_resets == {server._token_key("secret-token"): reset}
+
+        server._note_rate_limit(self._response(4999, reset), "secret-token")
+        assert not server._rate_limit_resets
+
+    def test_expired_resets_are_pruned(self):
+        """Test that windows that have already reset are dropped as new ones are noted."""
+        now = time.time()
+        server._rate_limit_resets[server._token_key("old-token")] = now - 1
+        server._rate_limit_resets[server._token_key("held-token")] = now + 30
+
+        server._note_rate_limit(self._response(1, now + 30), "new-token")
+
+        assert set(server._rate_limit_resets) == {
+            server._token_key("held-token"),
+            server._token_key("new-token"),
+        }
+
+
+class TestRetry:
+    """Tests for choosing retry delays and giving up."""
+
+    @pytest.fixture
+    def sleep(self, monkeypatch):
+        """Record retry sleeps instead of waiting."""
+        mocked = mock.AsyncMock()
+        monkeypatch.setattr(server.asyncio, "sleep", mocked)
+        return mocked
+
+    def test_retry_after_wins_over_rate_limit_reset(self):
+        """Test that Retry-After is honoured even when x-ratelimit-reset is also sent."""
+        response = httpx.Response(
+            403,
+            headers={
+                "retry-after": "3",
+                "x-ratelimit-remaining": "0",
+                "x-ratelimit-reset": str(time.time() + 30),
+            },
+        )
+
+        assert server._retry_delay(response, 0, True) == 3.0
+
+    def test_spent_rate_limit_waits_until_reset(self):
+        """Test that an exhausted rate limit waits until x-ratelimit-reset."""
+        response = httpx.Response(403, headers={"x-ratelimit-remaining": "0", "x-ratelimit-reset": str(time.time() + 30)})
+
+        assert server._retry_delay(response, 0, True) == pytest.approx(30, abs=1)
+
+    @pytest.mark.parametrize(
+        "headers",
+        [
+            {"retry-after": str(server.MAX_RETRY_WAIT + 1)},
+            {"x-ratelimit-remaining": "0", "x-ratelimit-reset": str(time.time() + 3600)},
+        ],
+    )
+    def test_long_waits_give_up(self, headers):
+        """Test that a wait longer than MAX_RETRY_WAIT fails instead of sleeping."""
+        assert server._retry_delay(httpx.Response(429, headers=headers), 0, True) is None
+
+    def test_backoff_doubles_up_to_the_cap(self, monkeypatch):
+        """Test exponential backoff, and giving up once it would pass MAX_RETRY_WAIT."""
+        monkeypatch.setattr(server, "RETRY_BACKOFF", 0.5)
+
+        assert [server._retry_delay(httpx.Response(502), attempt, True) for attempt in range(4)] == [0.5, 1.0, 2.0, 4.0]
+        assert server._retry_delay(httpx.Response(429), 6, False) == 32.0
+        assert server._retry_delay(httpx.Response(429), 7, False) is None
+
+    @pytest.mark.parametrize(("status", "retry_server_errors"), [(502, False), (400, True), (401, True)])
+    def test_other_failures_are_not_retried(self, status, retry_server_errors):
+        """Test that client errors, and server errors on mutations, aren't retried."""
+        assert server._retry_delay(httpx.Response(status), 0, retry_server_errors) is None
+
+    def test_retry_after_then_success(self, post, sleep):
+        """Test that a rate-limited request sleeps for Retry-After and then succeeds."""
+        post.side_effect = [httpx.Response(429, headers={"retry-after": "2"}), httpx.Response(200, json=VIEWER_RESULT)]
+
+        assert asyncio.run(server.run_query("query { viewer { login } }")) == VIEWER_RESULT
+
+        assert post.await_count == 2
+        sleep.assert_awaited_once_with(2.0)
+
+    def test_gives_up_after_last_attempt(self, post, sleep):
+        """Test that a persistent server error is tried MAX_RETRIES + 1 times, with no sleep after the last."""
+        post.return_value = httpx.Response(502)
+
+        with pytest.raises(Exception, match="Query failed with code 502"):
+            asyncio.run(server.run_query("query { viewer { login } }"))
+
+        assert post.await_count == server.MAX_RETRIES + 1
+        assert sleep.await_count == server.MAX_RETRIES
+
+
+class TestQuerySyntaxError:
+    """Tests for the local pre-check of query syntax."""
+
+    @pytest.mark.parametrize(
+        ("query", "error"),
+        [
+            ("", "query is empty"),
+            (" \n\t", "query is empty"),
+            ("query { viewer { login }", "unclosed '{' at line 1, column 7"),
+            ("query {\n  viewer { login } }\n}", "unexpected '}' at line 3, column 1"),
+            ("query { user(login: 1 { id } }", "unexpected '}' at line 1, column 30"),
+            ("query { viewer ) }", "unexpected ')' at line 1, column 16"),
+            ('query { user(login: "octocat) { id } }', "unterminated string at line 1, column 21"),
+            ('query { user(login: "octo\ncat") { id } }', "unterminated string at line 1, column 21"),
+            ('query { user(login: """octocat) { id } }', "unterminated block string at line 1, column 21"),
+        ],
+    )
+    def test_malformed_queries_are_reported(self, query, error):
+        """Test that empty queries, unbalanced brackets and unterminated strings are caught."""
+        assert server._query_syntax_error(query) == error
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "# Who am I? {\nquery { viewer { login } }",
+            "query { viewer { login } } # trailing ) comment",
+            'query { search(query: "a { b ( c", type: ISSUE, first: 1) { issueCount } }',
+            'query { search(query: "quote \\" } inside", type: ISSUE, first: 1) { issueCount } }',
+            'query { search(query: """ { multi\nline ) \\""" """, type: ISSUE, first: 1) { issueCount } }',
+        ],
+    )
+    def test_valid_queries_are_accepted(self, query):
+        """Test that brackets inside comments and strings don't count."""
+        assert server._query_syntax_error(query) is None
+
+    def test_tool_rejects_before_sending(self, post):
+        """Test that a malformed query is answered locally, without an HTTP request."""
+        result = json.loads(asyncio.run(server.github_graphql_query.fn("query { viewer { login }")))
+
+        assert result == {"error": "Invalid GraphQL query: unclosed '{' at line 1, column 7"}
+        post.assert_not_awaited()
+
+
+class TestQueryTool:
+    """Tests for the single-query tool."""
+
+    def test_oversized_variables_are_rejected_before_sending(self, post):
+        """Test that variables over MAX_VARIABLES_SIZE are refused without parsing or an HTTP request."""
+        variables = "x" * (server.MAX_VARIABLES_SIZE + 1)
+
+        result = json.loads(asyncio.run(server.github_graphql_query.fn("query { viewer { login } }", variables)))
+
+        assert result == {"error": f"variables parameter is too large ({server.MAX_VARIABLES_SIZE + 1} characters, limit {server.MAX_VARIABLES_SIZE})"}
+        post.assert_not_awaited()
+
+    def test_output_is_compact_unless_pretty(self, post):
+        """Test that results are compact JSON by default and indented with pretty=True."""
+        query = "query { viewer { login } }"
+
+        compact = asyncio.run(server.github_graphql_query.fn(query))
+        pretty = asyncio.run(server.github_graphql_query.fn(query, pretty=True))
+
+        assert "\n" not in compact
+        assert pretty.startswith('{\n  "')
+        assert json.loads(compact) == json.loads(pretty)
+
+
+class TestBatchFields:
+    """Tests for splitting a query into mergeable top-level fields."""
+
+    def test_plain_and_shorthand_queries(self):
+        """Test that the operation keyword and a leading comment are optional."""
+        expected = [("viewer", "viewer { login }")]
+        assert server._batch_fields("query { viewer { login } }") == expected
+        assert server._batch_fields("# Who am I\n{ viewer { login } }") == expected
+        assert server._batch_fields("query Me { viewer { login } }") == expected
+
+    def test_alias_is_response_key_and_dropped_from_source(self):
+        """Test that an aliased field is keyed by its alias, without the alias in the source."""
+        assert server._batch_fields("{ me: viewer { login } }") == [("me", "viewer { login }")]
+
+    def test_arguments_and_field_directives_are_kept(self):
+        """Test that arguments and field directives stay with their field."""
+        query = 'query { repository(owner: "a", name: "b") @include(if: true) { id } viewer @skip(if: false) { login } }'
+        assert server._batch_fields(query) == [
+            ("repository", 'repository(owner: "a", name: "b") @include(if: true) { id }'),
+            ("viewer", "viewer @skip(if: false) { login }"),
+        ]
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "query($login: String!) { user(login: $login) { id } }",
+            "{ viewer { ...UserFields } } fragment UserFields on User { login }",
+            "{ ... on Query { viewer { login } } }",
+            "{ ...QueryFields }",
+            "query @cached { viewer { login } }",
+            "mutation { addStar(input: {}) { clientMutationId } }",
+            "query A { viewer { login } } query B { viewer { name } }",
+        ],
+    )
+    def test_unmergeable_queries_are_rejected(self, query):
+        """Test that variables, fragments, operation directives, mutations and several operations aren't merged."""
+        assert server._batch_fields(query) is None
+
+
+class TestBatchTool:
+    """Tests for merging batched queries into shared requests."""
+
+    def test_same_fields_are_aliased_apart(self, post):
+        """Test that queries asking for the same field, or an alias that looks like a merged one, don't collide."""
+        post.return_value = httpx.Response(
+            200,
+            json={
+                "data": {
+                    "q0_viewer": {"login": "octocat"},
+                    "q1_viewer": {"name": "Mona"},
+                    "q2_q1_viewer": {"id": "U_1"},
+                }
+            },
+        )
+
+        results = _run_batch(
+            [
+                "{ viewer { login } }",
+                "query { viewer { name } }",
+                "{ q1_viewer: viewer { id } }",
+            ]
+        )
+
+        assert post.await_count == 1
+        sent = _sent_query(post.await_args)
+        assert "q0_viewer: viewer { login }" in sent
+        assert "q1_viewer: viewer { name }" in sent
+        assert "q2_q1_viewer: viewer { id }" in sent
+        assert results == [
+            {"viewer": {"login": "octocat"}},
+            {"viewer": {"name": "Mona"}},
+            {"q1_viewer": {"id": "U_1"}},
+        ]
+
+    def test_field_directives_are_sent(self, post):
+        """Test that a field's directives survive merging."""
+        post.return_value = httpx.Response(200, json={"data": {"q0_viewer": {"login": "octocat"}, "q1_rateLimit": None}})
+
+        results = _run_batch(["{ viewer @include(if: true) { login } }", "{ rateLimit @skip(if: true) { remaining } }"])
+
+        sent = _sent_query(post.await_args)
+        assert "q0_viewer: viewer @include(if: true) { login }" in sent
+        assert "q1_rateLimit: rateLimit @skip(if: true) { remaining }" in sent
+        assert results == [{"viewer": {"login": "octocat"}}, {"rateLimit": None}]
+
+    def test_fragments_and_variables_run_separately(self, post):
+        """Test that queries that can't be merged are sent as written."""
+        fragment_query = "{ viewer { ...UserFields } } fragment UserFields on User { login }"
+        variables_query = "query($login: String!) { user(login: $login) { id } }"
+
+        results = _run_batch([fragment_query, variables_query])
+
+        assert post.await_count == 2
+        assert sorted(_sent_query(call) for call in post.await_args_list) == sorted([fragment_query, variables_query])
+        assert results == [{"viewer": {"login": "octocat"}}] * 2
+
+    def test_error_paths_are_remapped(self, post):
+        """Test that an error is returned with the query it belongs to, under its own path."""
+        post.return_value = httpx.Response(
+            200,
+            json={
+                "data": {"q0_viewer": {"login": "octocat"}, "q1_repository": None},
+                "errors": [
+                    {
+                        "type": "NOT_FOUND",
+                        "message": "Could not resolve to a Repository.",
+                        "path": ["q1_repository", "issues"],
+                        "locations": [{"line": 3, "column": 3}],
+                    }
+                ],
+            },
+        )
+
+        results = _run_batch(["{ viewer { login } }", '{ repository(owner: "a", name: "missing") { issues { totalCount } } }'])
+
+        assert post.await_count == 1
+        assert results[0] == {"viewer": {"login": "octocat"}}
+        assert results[1] == {
+            "errors": [
+                {
+                    "type": "NOT_FOUND",
+                    "message": "Could not resolve to a Repository.",
+                    "path": ["repository", "issues"],
+                }
+            ],
+            "data": {"repository": None},
+        }
+
+    def test_unattributable_error_falls_back_to_separate_requests(self, post):
+        """Test that an error without a path reruns each query on its own."""
+        post.side_effect = [
+            httpx.Response(200, json={"errors": [{"message": "Something went wrong"}]}),
+            httpx.Response(200, json=VIEWER_RESULT),
+            httpx.Response(200, json=VIEWER_RESULT),
+        ]
+
+        results = _run_batch(["{ viewer { login } }", "query { viewer { login } }"])
+
+        assert post.await_count == 3
+        assert [_sent_query(call) for call in post.await_args_list[1:]] == ["{ viewer { login } }", "query { viewer { login } }"]
+        assert results == [{"viewer": {"login": "octocat"}}] * 2